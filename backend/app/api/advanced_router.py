@@ -456,7 +456,7 @@ async def parse_url_schedule(
         - 이미 지난 일정은 제외
         """
         
-        response = model.generate_content(prompt)
+        response = await model.generate_content_async(prompt)
         result = json.loads(response.text)
         
         schedules = result.get("schedules", [])
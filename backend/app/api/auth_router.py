@@ -26,7 +26,7 @@ from app.core.auth import (
     TokenService, UserRole, TokenPayload, Permission,
     get_current_user_required, RBACChecker, AdminOnly
 )
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, get_password_hash_async, verify_password
 
 load_dotenv()
 
@@ -264,7 +264,7 @@ def get_me(current_user: TokenPayload = Depends(get_current_user_required)):
             "user_id": current_user.user_id,
             "email": current_user.email,
             "role": current_user.role.value,
-            "permissions": [p.value for p in current_user.permissions]
+            "permissions": sorted(p.value for p in current_user.permissions)
         }
     )
 
@@ -355,7 +355,7 @@ async def google_callback(
         # 새 사용자 생성
         user = User(
             email=email,
-            password=get_password_hash(secrets.token_urlsafe(32)),  # 랜덤 비밀번호
+            password=await get_password_hash_async(secrets.token_urlsafe(32)),  # 랜덤 비밀번호
             role=UserRole.USER.value,
             oauth_provider="google",
             oauth_id=google_id,
@@ -460,7 +460,7 @@ async def kakao_callback(
     else:
         user = User(
             email=email,
-            password=get_password_hash(secrets.token_urlsafe(32)),
+            password=await get_password_hash_async(secrets.token_urlsafe(32)),
             role=UserRole.USER.value,
             oauth_provider="kakao",
             oauth_id=kakao_id,
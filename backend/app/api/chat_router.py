@@ -19,6 +19,7 @@ import os
 import json
 import re
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta, date
 from typing import Optional
 
@@ -93,12 +94,16 @@ CATEGORY_MAP = {
     "personal": "개인", "other": "기타",
 }
 
+# 마크다운 코드 펜스 (```json / ```) 제거용 - 한 번의 치환으로 모두 처리
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*")
+
 # ============================================================
 # 유틸리티 함수
 # ============================================================
 
+@lru_cache(maxsize=4)
 def get_gemini_model():
-    """Gemini 모델 인스턴스 반환 (JSON 모드 활성화)"""
+    """Gemini 모델 인스턴스 반환 (JSON 모드 활성화, 요청 간 재사용)"""
     return genai.GenerativeModel(
         model_name=GEMINI_MODEL_NAME,
         generation_config={
@@ -1271,16 +1276,14 @@ async def chat_with_ai(
         system_prompt = build_system_prompt(req, current_date_str)
         
         # 2. Gemini 호출 (JSON 모드로 인해 후처리 불필요)
-        response = model.generate_content(system_prompt)
+        response = await model.generate_content_async(system_prompt)
         
         # 3. 결과 파싱 (Gemini가 JSON을 보장하므로 바로 로드)
         try:
             parsed_data = json.loads(response.text)
         except json.JSONDecodeError:
             # 혹시라도 마크다운이 섞여있을 경우 대비 (안전장치)
-            text = response.text
-            text = re.sub(r"```json\s*", "", text)
-            text = re.sub(r"```", "", text)
+            text = _CODE_FENCE_RE.sub("", response.text)
             parsed_data = json.loads(text)
             
         ai_result = AIChatParsed(**parsed_data)
@@ -7,7 +7,6 @@ from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 from datetime import datetime
 import asyncio
-import json
 
 from app.core.event_bus import sse_manager, event_bus, EventType, EventPayload
 
@@ -29,7 +28,7 @@ def _setup_event_handlers():
             payload.data
         )
     
-    # 모든 알림 관련 이벤트 구독
+    # 모든 알림 관련 이벤트 구독 (리스너가 이벤트 루프에서 직접 await)
     for event_type in [
         EventType.NOTIFICATION_CREATED,
         EventType.NOTIFICATION_SENT,
@@ -37,11 +36,7 @@ def _setup_event_handlers():
         EventType.DEADLINE_ALERT,
         EventType.DAILY_SUMMARY,
     ]:
-        def create_handler(et):
-            def handler(payload: EventPayload):
-                asyncio.create_task(forward_to_sse(payload))
-            return handler
-        event_bus.subscribe(event_type, create_handler(event_type))
+        event_bus.subscribe(event_type, forward_to_sse)
 
 
 # 서버 시작 시 핸들러 설정
@@ -67,7 +62,7 @@ async def event_stream(request: Request):
     async def event_generator():
         try:
             # 초기 연결 확인 이벤트
-            yield f"event: connected\ndata: {json.dumps({'user_id': user_id, 'timestamp': datetime.now().isoformat()})}\n\n"
+            yield sse_manager.encode_event("connected", {"user_id": user_id, "timestamp": datetime.now()})
             
             while True:
                 # 연결 종료 확인
@@ -76,15 +71,11 @@ async def event_stream(request: Request):
                 
                 try:
                     # 이벤트 대기 (30초 타임아웃 후 heartbeat)
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    
-                    event_type = event.get("event", "message")
-                    event_data = json.dumps(event.get("data", {}))
-                    
-                    yield f"event: {event_type}\ndata: {event_data}\n\n"
+                    # 큐에는 SSEManager가 미리 인코딩한 SSE 프레임(bytes)이 들어 있음
+                    yield await asyncio.wait_for(queue.get(), timeout=30.0)
                 except asyncio.TimeoutError:
                     # Heartbeat 전송 (연결 유지)
-                    yield f"event: heartbeat\ndata: {json.dumps({'timestamp': datetime.now().isoformat()})}\n\n"
+                    yield sse_manager.encode_event("heartbeat", {"timestamp": datetime.now()})
         finally:
             sse_manager.disconnect(user_id, queue)
     
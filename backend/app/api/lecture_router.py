@@ -8,7 +8,7 @@ from app.db.database import get_db
 from app.models.lecture import Lecture
 from app.schemas.lecture import SaveLectureRequest, UpdateLectureRequest, LectureResponse
 from app.schemas.common import ResponseDTO
-from app.core.cache import cache_service
+from app.core.cache import cache_service, async_cache_service
 from app.core.auth import get_current_user_optional, TokenPayload
 
 
@@ -49,7 +49,7 @@ async def create_lectures(
         for l in saved_lectures: db.refresh(l)
         
         # 강의 캐시 무효화
-        cache_service.invalidate_lectures(user_id)
+        await async_cache_service.invalidate_lectures(user_id)
 
         return ResponseDTO(
             status=200,
@@ -137,7 +137,7 @@ async def get_lectures(
         cache_key = f"lectures:{user_id}:{from_date}:{to_date}"
         
         # 캐시 먼저 확인
-        cached = cache_service.get(cache_key)
+        cached = await async_cache_service.get(cache_key)
         if cached is not None:
             return ResponseDTO(
                 status=200,
@@ -158,7 +158,7 @@ async def get_lectures(
         lecture_data = [LectureResponse.from_orm_custom(l).dict() for l in lectures]
         
         # 캐시에 저장 (1시간 TTL)
-        cache_service.set(cache_key, lecture_data, cache_service.LONG_TTL)
+        await async_cache_service.set(cache_key, lecture_data, async_cache_service.LONG_TTL)
 
         return ResponseDTO(
             status=200,
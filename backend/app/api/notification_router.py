@@ -9,7 +9,7 @@ from app.models.notification import Notification
 from app.models.schedule import Schedule
 from app.schemas.notification import CreateNotificationRequest, NotificationResponse, CheckNotificationRequest
 from app.schemas.common import ResponseDTO
-from app.core.cache import cache_service
+from app.core.cache import async_cache_service
 from app.core.auth import get_current_user_optional, TokenPayload
 
 
@@ -61,7 +61,7 @@ async def create_notification(
         db.refresh(new_notification)
         
         # 알림 캐시 무효화
-        cache_service.invalidate_notifications(user_id)
+        await async_cache_service.invalidate_notifications(user_id)
         
         return ResponseDTO(
             status=200,
@@ -90,7 +90,7 @@ async def get_pending_notifications(
         user_id = current_user.user_id
         
         # 캐시 먼저 확인 (30초 TTL)
-        cached = cache_service.get_pending_notifications(user_id)
+        cached = await async_cache_service.get_pending_notifications(user_id)
         if cached is not None:
             return ResponseDTO(
                 status=200,
@@ -115,7 +115,7 @@ async def get_pending_notifications(
         
         # 결과를 캐시에 저장 (빈 리스트도 캐싱하여 DB 호출 방지)
         result = [NotificationResponse.model_validate(n).model_dump() for n in notifications]
-        cache_service.set_pending_notifications(user_id, result)
+        await async_cache_service.set_pending_notifications(user_id, result)
         
         return ResponseDTO(
             status=200,
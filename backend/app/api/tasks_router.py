@@ -10,7 +10,7 @@ from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
-from app.core.cache import cache_service
+from app.core.cache import async_cache_service
 from app.tasks.ai_tasks import process_ai_chat, analyze_schedule_image, recalculate_user_priorities
 from app.tasks.notification_tasks import send_schedule_reminder, batch_create_notifications
 from app.core.auth import get_current_user
@@ -229,7 +229,7 @@ async def get_task_status(task_id: str):
     """
     try:
         # 캐시에서 상태 조회
-        status = cache_service.get_task_status(task_id)
+        status = await async_cache_service.get_task_status(task_id)
         
         if status:
             return APIResponse(
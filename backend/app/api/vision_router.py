@@ -1,15 +1,25 @@
 import os
-import json
+import asyncio
+import hashlib
+import io
+import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, List
+from cachetools import TTLCache
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import StreamingResponse, ORJSONResponse
+from PIL import Image, ImageOps
 from dotenv import load_dotenv
 
 # Google Gemini SDK
 import google.generativeai as genai
 
 # 기존 스키마 재사용 (Frontend 호환성 유지)
-from app.schemas.ai_chat import APIResponse, ChatResponseData, AIChatParsed
+from app.schemas.ai_chat import ChatResponseData, AIChatParsed, VisionResult
+from app.core.cache import async_cache_service
+from app.core.event_bus import SSEManager
 
 load_dotenv()
 router = APIRouter()
@@ -19,30 +29,65 @@ logger = logging.getLogger(__name__)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash")
 
+# 스트리밍 응답 최대 길이 (이 이상이면 반복/형식 오류로 보고 중단)
+MAX_STREAM_CHARS = int(os.getenv("VISION_MAX_STREAM_CHARS", "32000"))
+
+# 업로드 이미지 최대 크기 및 읽기 단위
+MAX_UPLOAD_BYTES = int(os.getenv("VISION_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Gemini로 보내기 전 이미지 긴 변 최대 길이 (px) - 이보다 크면 축소
+# 시간표/포스터 글자 인식에는 1024px이면 충분하고, 이미지 토큰 수가 크게 줄어듦
+MAX_IMAGE_SIDE = int(os.getenv("VISION_MAX_IMAGE_SIDE", "1024"))
+# 이보다 작은 파일은 디코딩 비용을 아끼기 위해 그대로 전송
+DOWNSCALE_MIN_BYTES = int(os.getenv("VISION_DOWNSCALE_MIN_BYTES", str(200 * 1024)))
+# 축소한 이미지는 JPEG로 다시 인코딩 (PNG 스크린샷도 크기가 크게 줄어듦)
+DOWNSCALE_JPEG_QUALITY = 85
+
+# 이미지 디코딩/축소 전용 스레드 풀 (Starlette 기본 풀과 분리해 과다 구독 방지)
+IMAGE_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+_image_executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="vision-image")
+# 스레드 풀에서 처리 중이거나 대기 중인 이미지가 이 수를 넘으면 503으로 즉시 거절 (과부하 시 빠른 실패)
+# 워커 수와 별도로 잡아, 평소 동시 업로드는 스레드 풀 대기열에서 순서대로 처리
+IMAGE_QUEUE = int(os.getenv("VISION_IMAGE_QUEUE", str(IMAGE_WORKERS * 16)))
+_image_slots = asyncio.Semaphore(IMAGE_QUEUE)
+
+# 동일 이미지 재업로드 시 Gemini 호출을 건너뛰기 위한 분석 결과 캐시
+# 키: sha256(날짜 + MIME + 이미지 bytes) - 날짜가 바뀌면 상대 날짜 해석이 달라지므로 키에 포함
+# 프로세스 내 TTLCache를 먼저 보고, 없으면 워커 간 공유되는 Redis(cache_service)를 조회
+RESULT_CACHE_SIZE = int(os.getenv("VISION_RESULT_CACHE_SIZE", "1024"))
+RESULT_CACHE_TTL = int(os.getenv("VISION_RESULT_CACHE_TTL", "3600"))
+_result_cache: TTLCache = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+
+# 이 크기를 넘는 이미지는 요청에 직접 싣지 않고 File API로 업로드 후 참조로 전달
+# 전처리에서 긴 변 MAX_IMAGE_SIDE의 JPEG로 줄이므로, 실제로는 디코딩하지 못한 이미지나
+# 큰 SVG처럼 축소되지 않은 이미지만 이 경로를 탐
+INLINE_IMAGE_MAX_BYTES = int(os.getenv("VISION_INLINE_IMAGE_MAX_BYTES", str(4 * 1024 * 1024)))
+
+# 동시에 진행할 수 있는 Gemini 호출 수 (업로드 폭주 시 이벤트 루프/쿼터 보호)
+GEMINI_CONCURRENCY = int(os.getenv("VISION_GEMINI_CONCURRENCY", "8"))
+_gemini_slots = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+# 일괄 분석(/analyze/batch) 한 번에 받을 수 있는 최대 이미지 수와 전처리 후 총 크기
+MAX_BATCH_FILES = int(os.getenv("VISION_MAX_BATCH_FILES", "20"))
+MAX_BATCH_TOTAL_BYTES = int(os.getenv("VISION_MAX_BATCH_TOTAL_BYTES", str(40 * 1024 * 1024)))
+# 일괄 분석 이미지를 Redis에 보관하는 시간 (초) - 워커가 처리 후 삭제, 남은 것은 만료
+BATCH_UPLOAD_TTL = int(os.getenv("VISION_BATCH_UPLOAD_TTL", "1800"))
+
+# 포스터 분석 시 준비 단계(sub-task) 제목에 붙는 표식
+PREP_TASK_MARKER = "[준비]"
+
 if not GOOGLE_API_KEY:
     logger.error("GOOGLE_API_KEY is missing in environment variables.")
 
 genai.configure(api_key=GOOGLE_API_KEY)
 
-# JSON 응답을 강제하기 위한 모델 설정
-model = genai.GenerativeModel(
-    model_name=GEMINI_MODEL_NAME,
-    generation_config={
-        "temperature": 0.1,
-        "response_mime_type": "application/json"
-    }
-)
-
-async def analyze_image_with_gemini(image_bytes: bytes, mime_type: str = "image/jpeg") -> dict:
-    """
-    이미지를 Gemini에게 전송하여 시간표(Schedule) 또는 포스터(Poster) 정보를 추출
-    """
-    today_str = datetime.now().strftime('%Y-%m-%d')
-    
-    # 통합 프롬프트: 분류와 추출을 한 번에 수행
-    prompt = f"""
+# --- [프롬프트] 요청마다 변하지 않는 지시문은 모델의 system_instruction으로 한 번만 설정 ---
+# 요청(user turn)에는 이미지와 날짜만 담아 보낸다
+# 지시문이 바이트 단위로 동일하게 유지되어야 prefix 캐시가 적용된다
+_SYSTEM_INSTRUCTION = """
     You are an AI Assistant capable of analyzing university timetables and event posters.
-    Current Date: {today_str}
+    The reference date for relative expressions is given after the image.
 
     [TASK]
     1. **Classify**: Determine if the image is a 'schedule' (University Timetable) or a 'poster' (Event/Contest/Recruitment).
@@ -61,95 +106,410 @@ async def analyze_image_with_gemini(image_bytes: bytes, mime_type: str = "image/
     - Importance Score: 1~10.
 
     [OUTPUT JSON FORMAT]
-    {{
+    {
       "image_type": "schedule" | "poster",
       "lectures": [  // If schedule
-        {{
+        {
           "title": "Course Name",
           "start_time": "HH:MM",
           "end_time": "HH:MM",
           "week": 0, // Integer (0=Mon)
           "location": "Room info"
-        }}
+        }
       ],
       "actions": [ // If poster (Compatible with your existing AIChatParsed schema)
-        {{
+        {
           "op": "CREATE",
-          "payload": {{
+          "payload": {
              "title": "Event Title",
              "end_at": "YYYY-MM-DDTHH:MM:SS",
              "category": "공모전" | "대외활동" | "기타",
              "importance_score": 8,
              "estimated_minute": 60
-          }}
-        }}
+          }
+        }
       ]
-    }}
+    }
+    """
+
+
+SYSTEM_INSTRUCTION_SHA256 = hashlib.sha256(_SYSTEM_INSTRUCTION.encode("utf-8")).hexdigest()
+logger.info(f"Vision system instruction sha256={SYSTEM_INSTRUCTION_SHA256[:12]}")
+
+# JSON 응답을 강제하기 위한 모델 설정 (지시문은 모델 생성 시 한 번만 지정)
+model = genai.GenerativeModel(
+    model_name=GEMINI_MODEL_NAME,
+    system_instruction=_SYSTEM_INSTRUCTION,
+    generation_config={
+        "temperature": 0.1,
+        "response_mime_type": "application/json"
+    }
+)
+
+
+def build_contents(image_bytes: bytes, mime_type: str, uploaded_file=None) -> list:
+    """
+    Gemini 요청 contents 구성: [이미지, 날짜] (지시문은 system_instruction)
+    uploaded_file이 있으면 inline bytes 대신 File API 참조를 사용
+    """
+    today_str = datetime.now().strftime('%Y-%m-%d')
+    image_part = uploaded_file if uploaded_file is not None else {"mime_type": mime_type, "data": image_bytes}
+    return [
+        image_part,
+        f"Current Date: {today_str}",
+    ]
+
+
+async def read_upload(file: UploadFile) -> bytes:
+    """
+    업로드 파일을 청크 단위로 읽어 bytes로 반환
+    MAX_UPLOAD_BYTES를 넘으면 전체를 읽기 전에 413으로 중단
+    """
+    buf = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="이미지 파일이 너무 큽니다.")
+    return bytes(buf)
+
+
+def needs_downscale(image_bytes: bytes, mime_type: str) -> bool:
+    """디코딩해 볼 필요가 있는 이미지인지 (작은 파일/SVG는 그대로 전송)"""
+    return len(image_bytes) >= DOWNSCALE_MIN_BYTES and mime_type != "image/svg+xml"
+
+
+def downscale_image(image_bytes: bytes, mime_type: str) -> tuple:
+    """
+    긴 변이 MAX_IMAGE_SIDE를 넘는 이미지를 비율 유지하며 축소 후 JPEG로 재인코딩
+    작은 파일/이미지, SVG는 그대로 반환, 디코딩 실패 시에도 원본 반환
+    반환: (이미지 bytes, MIME 타입)
+    """
+    if not needs_downscale(image_bytes, mime_type):
+        return image_bytes, mime_type
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            if max(img.size) <= MAX_IMAGE_SIDE:
+                return image_bytes, mime_type
+
+            # 휴대폰 사진의 EXIF 회전 정보를 픽셀에 반영 (저장 시 EXIF가 빠지므로)
+            resized = ImageOps.exif_transpose(img)
+            resized.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.Resampling.LANCZOS)
+            if resized.mode != "RGB":
+                resized = resized.convert("RGB")
+
+            out = io.BytesIO()
+            resized.save(out, format="JPEG", quality=DOWNSCALE_JPEG_QUALITY, optimize=True)
+            return out.getvalue(), "image/jpeg"
+    except Exception as e:
+        logger.warning(f"Image downscale skipped: {e}")
+        return image_bytes, mime_type
+
+
+async def preprocess_image(image_bytes: bytes, mime_type: str) -> tuple:
+    """전용 스레드 풀에서 이미지 축소 실행 (대기열이 가득 차면 503), 반환: (bytes, MIME)"""
+    # 디코딩이 필요 없는 이미지는 슬롯을 잡지 않고 바로 반환
+    if not needs_downscale(image_bytes, mime_type):
+        return image_bytes, mime_type
+    if _image_slots.locked():
+        raise HTTPException(status_code=503, detail="이미지 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+    async with _image_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_image_executor, downscale_image, image_bytes, mime_type)
+
+
+_STREAM_END = object()
+
+
+async def _pull_gemini(image_bytes: bytes, mime_type: str, queue: asyncio.Queue) -> None:
+    """
+    Gemini 스트림을 끝까지 받아 queue에 넣음 (오류는 예외 객체로 전달, 마지막은 _STREAM_END)
+    Gemini 슬롯은 이 구간에서만 점유하므로 느린 SSE 클라이언트가 슬롯을 붙잡지 않음
     """
+    try:
+        async with _gemini_slots:
+            uploaded_file = None
+            if len(image_bytes) > INLINE_IMAGE_MAX_BYTES:
+                # 큰 이미지는 File API로 올려 요청 본문에 bytes를 싣지 않음
+                uploaded_file = await asyncio.to_thread(
+                    genai.upload_file, io.BytesIO(image_bytes), mime_type=mime_type
+                )
+            try:
+                response = await model.generate_content_async(
+                    build_contents(image_bytes, mime_type, uploaded_file),
+                    stream=True
+                )
+                received = 0
+                async for chunk in response:
+                    text = chunk.text
+                    received += len(text)
+                    if received > MAX_STREAM_CHARS:
+                        raise ValueError(f"stream exceeded {MAX_STREAM_CHARS} chars")
+                    queue.put_nowait(text)
+            finally:
+                if uploaded_file is not None:
+                    try:
+                        await asyncio.to_thread(genai.delete_file, uploaded_file.name)
+                    except Exception as e:
+                        logger.warning(f"Uploaded image cleanup failed: {e}")
+    except Exception as e:
+        queue.put_nowait(e)
+    finally:
+        queue.put_nowait(_STREAM_END)
+
+
+async def stream_gemini(image_bytes: bytes, mime_type: str):
+    """
+    Gemini 응답을 스트리밍으로 받아 텍스트 조각을 순서대로 yield
+    누적 길이가 MAX_STREAM_CHARS를 넘으면 (반복 생성 등) ValueError로 중단
+    동시 호출 수는 GEMINI_CONCURRENCY로 제한 (Gemini에서 받는 동안만 슬롯 점유)
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    producer = asyncio.create_task(_pull_gemini(image_bytes, mime_type, queue))
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # 클라이언트가 먼저 끊으면 Gemini 스트림도 중단
+        if not producer.done():
+            producer.cancel()
+
+
+def result_cache_key(image_bytes: bytes, mime_type: str) -> str:
+    """분석 결과 캐시 키 (같은 날 같은 이미지면 같은 키)"""
+    digest = hashlib.sha256()
+    digest.update(f"{datetime.now().strftime('%Y-%m-%d')}:{mime_type}:".encode("utf-8"))
+    digest.update(image_bytes)
+    return digest.hexdigest()
+
+
+async def get_cached_result(cache_key: str) -> VisionResult:
+    """분석 결과 조회 (프로세스 캐시 -> Redis 순)"""
+    cached = _result_cache.get(cache_key)
+    if cached is None:
+        result_json = await async_cache_service.get_vision_result(cache_key)
+        if result_json is not None:
+            cached = VisionResult.model_validate(result_json)
+            _result_cache[cache_key] = cached
+    return cached
+
+
+async def store_result(cache_key: str, result: VisionResult, raw: bytes):
+    """
+    분석 결과를 프로세스 캐시와 Redis에 함께 저장
+    Redis에는 Gemini가 준 JSON bytes(raw)를 그대로 저장해 재직렬화 생략
+    """
+    _result_cache[cache_key] = result
+    await async_cache_service.set_vision_result(cache_key, raw=raw)
+
+
+async def analyze_image_with_gemini(image_bytes: bytes, mime_type: str = "image/jpeg") -> VisionResult:
+    """
+    이미지를 Gemini에게 전송하여 시간표(Schedule) 또는 포스터(Poster) 정보를 추출
+    같은 이미지의 분석 결과가 캐시에 있으면 Gemini 호출 없이 반환
+    """
+    cache_key = result_cache_key(image_bytes, mime_type)
+    cached = await get_cached_result(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        response = model.generate_content([
-            {"mime_type": mime_type, "data": image_bytes},
-            prompt
-        ])
-        return json.loads(response.text)
+        # 통합 프롬프트: 분류와 추출을 한 번에 수행 (스트리밍으로 받아 한 번에 파싱)
+        chunks = [text async for text in stream_gemini(image_bytes, mime_type)]
+        raw = "".join(chunks).encode("utf-8")
+        # 파싱과 스키마 검증을 pydantic-core에서 한 번에 수행
+        result = VisionResult.model_validate_json(raw)
     except Exception as e:
         logger.error(f"Gemini Analysis Error: {e}")
         raise HTTPException(status_code=500, detail="AI Analysis Failed")
 
+    # temperature가 낮아 같은 입력이면 결과가 사실상 동일 -> 재사용 안전
+    await store_result(cache_key, result, raw)
+    return result
+
+
+def build_response_data(result: VisionResult) -> ChatResponseData:
+    """Gemini 분석 결과를 프론트엔드 응답 형식으로 변환"""
+    image_type = result.image_type
+    lectures_data = result.lectures
+    actions_data = result.actions
+
+    ai_parsed_result = AIChatParsed(
+        intent="SCHEDULE_MUTATION",
+        type="TASK" if image_type == 'poster' else "UNKNOWN",
+        actions=actions_data
+    )
 
-@router.post("/analyze", response_model=APIResponse)
+    # Assistant Message 생성
+    assistant_msg = ""
+    if image_type == 'schedule':
+        count = len(lectures_data)
+        assistant_msg = f"[SCHEDULE] 분석 완료: {count}건의 강의를 시간표에서 발견했습니다."
+        # 스케줄 모드일 때는 actions를 비워둡니다 (기존 로직 유지)
+        ai_parsed_result.actions = []
+
+    elif image_type == 'poster':
+        # 한 번의 순회로 준비 단계(sub-task) 개수를 세고 나머지를 주요 일정으로 분류
+        sub_count = sum(
+            1 for a in actions_data
+            if PREP_TASK_MARKER in (a.payload.get('title') or '')
+        )
+        main_count = len(actions_data) - sub_count
+        assistant_msg = f"[POSTER] 분석 완료: 주요 일정 {main_count}건"
+        if sub_count:
+            assistant_msg += f"과 준비 단계 {sub_count}건을 제안합니다."
+    else:
+        assistant_msg = "이미지에서 일정 정보를 찾을 수 없습니다."
+
+    return ChatResponseData(
+        parsed_result=ai_parsed_result,
+        assistant_message=assistant_msg,
+        lectures=lectures_data if image_type == 'schedule' else []
+    )
+
+
+def api_response(status: int, message: str, data: Any = None) -> ORJSONResponse:
+    """
+    APIResponse 형식을 orjson으로 바로 직렬화
+    data는 이미 검증된 모델이므로 response_model 재검증 없이 alias(camelCase)로 덤프
+    """
+    if isinstance(data, ChatResponseData):
+        data = data.model_dump(mode="json", by_alias=True)
+    payload = {
+        "status": status,
+        "message": message,
+        "data": data,
+    }
+    return ORJSONResponse(content=payload)
+
+
+@router.post("/analyze", response_class=ORJSONResponse)
 async def analyze_image_schedule(file: UploadFile = File(...)):
     """
     이미지 업로드 -> Gemini 분석 -> 결과 반환
     """
     try:
-        # 1. 파일 읽기
-        contents = await file.read()
+        # 1. 파일 읽기 (크기 제한)
+        contents = await read_upload(file)
         mime_type = file.content_type or "image/jpeg"
+        contents, mime_type = await preprocess_image(contents, mime_type)
 
         # 2. Gemini 호출 (OCR + LLM 통합)
-        result_json = await analyze_image_with_gemini(contents, mime_type)
-        
-        image_type = result_json.get("image_type", "unknown")
-        lectures_data = result_json.get("lectures", [])
-        actions_data = result_json.get("actions", [])
-
-        # 3. 응답 메시지 및 데이터 구성
-        ai_parsed_result = AIChatParsed(
-            intent="SCHEDULE_MUTATION",
-            type="TASK" if image_type == 'poster' else "UNKNOWN",
-            actions=actions_data
-        )
+        result = await analyze_image_with_gemini(contents, mime_type)
+
+        # 3. 최종 반환
+        return api_response(200, "Success", build_response_data(result))
+
+    except HTTPException as e:
+        return api_response(e.status_code, e.detail)
+    except Exception as e:
+        logger.error(f"Server Error: {str(e)}")
+        return api_response(500, f"Server Error: {str(e)}")
 
-        # Assistant Message 생성
-        assistant_msg = ""
-        if image_type == 'schedule':
-            count = len(lectures_data)
-            assistant_msg = f"[SCHEDULE] 분석 완료: {count}건의 강의를 시간표에서 발견했습니다."
-            # 스케줄 모드일 때는 actions를 비워둡니다 (기존 로직 유지)
-            ai_parsed_result.actions = [] 
-            
-        elif image_type == 'poster':
-            main_tasks = [a for a in actions_data if "[준비]" not in a.get('payload', {}).get('title', '')]
-            sub_tasks = [a for a in actions_data if "[준비]" in a.get('payload', {}).get('title', '')]
-            assistant_msg = f"[POSTER] 분석 완료: 주요 일정 {len(main_tasks)}건"
-            if sub_tasks:
-                assistant_msg += f"과 준비 단계 {len(sub_tasks)}건을 제안합니다."
-        else:
-            assistant_msg = "이미지에서 일정 정보를 찾을 수 없습니다."
-
-        # 4. 최종 반환
-        return APIResponse(
-            status=200, 
-            message="Success", 
-            data=ChatResponseData(
-                parsed_result=ai_parsed_result,
-                assistant_message=assistant_msg,
-                lectures=lectures_data if image_type == 'schedule' else []
+
+@router.post("/analyze/batch", response_class=ORJSONResponse)
+async def analyze_image_batch(files: List[UploadFile] = File(...)):
+    """
+    여러 이미지 일괄 분석 (비동기)
+
+    이미지 bytes는 Redis에 짧은 TTL로 저장하고 Celery 작업에는 키만 넘긴 뒤 바로 task_id를 반환
+    진행 상황과 결과는 /api/tasks/status/{task_id} 로 조회
+    """
+    from app.tasks.ai_tasks import analyze_vision_batch, vision_batch_time_limits
+
+    if len(files) > MAX_BATCH_FILES:
+        return api_response(413, f"한 번에 최대 {MAX_BATCH_FILES}장까지 분석할 수 있습니다.")
+
+    try:
+        prepared = []
+        total_bytes = 0
+        for file in files:
+            contents, mime_type = await preprocess_image(
+                await read_upload(file), file.content_type or "image/jpeg"
             )
+            total_bytes += len(contents)
+            if total_bytes > MAX_BATCH_TOTAL_BYTES:
+                return api_response(413, "일괄 분석 이미지의 전체 크기가 너무 큽니다.")
+            prepared.append((file.filename, contents, mime_type))
+
+        # 이미지 bytes는 브로커 메시지 대신 Redis에 보관하고 참조만 전달
+        images = []
+        for filename, contents, mime_type in prepared:
+            upload_id = uuid.uuid4().hex
+            if not await async_cache_service.set_vision_upload(upload_id, contents, BATCH_UPLOAD_TTL):
+                return api_response(503, "일괄 분석을 사용할 수 없습니다. 잠시 후 다시 시도해주세요.")
+            images.append({
+                "filename": filename,
+                "mime_type": mime_type,
+                "upload_id": upload_id,
+                "cache_key": result_cache_key(contents, mime_type),
+            })
+
+        soft_limit, hard_limit = vision_batch_time_limits(len(images))
+        task = analyze_vision_batch.apply_async(
+            kwargs={"images": images}, soft_time_limit=soft_limit, time_limit=hard_limit
         )
 
+        return api_response(202, "이미지 일괄 분석이 시작되었습니다. task_id로 상태를 조회하세요.", {
+            "task_id": task.id,
+            "status": "submitted",
+            "count": len(images),
+        })
+
+    except HTTPException as e:
+        return api_response(e.status_code, e.detail)
     except Exception as e:
-        logger.error(f"Server Error: {str(e)}")
-        return APIResponse(status=500, message=f"Server Error: {str(e)}")
\ No newline at end of file
+        logger.error(f"Batch Submit Error: {str(e)}")
+        return api_response(500, f"Server Error: {str(e)}")
+
+
+@router.post("/analyze/stream")
+async def analyze_image_schedule_stream(file: UploadFile = File(...)):
+    """
+    이미지 업로드 -> Gemini 스트리밍 분석 (SSE)
+
+    생성되는 토큰을 `token` 이벤트로 바로 흘려보내고,
+    생성이 끝나면 /analyze 와 같은 형식의 결과를 `done` 이벤트로 전송
+    """
+    contents = await read_upload(file)
+    mime_type = file.content_type or "image/jpeg"
+    contents, mime_type = await preprocess_image(contents, mime_type)
+
+    cache_key = result_cache_key(contents, mime_type)
+
+    async def event_generator():
+        chunks = []
+        try:
+            # 이미 분석한 이미지면 토큰 없이 바로 결과 전송
+            cached = await get_cached_result(cache_key)
+            if cached is not None:
+                data = build_response_data(cached).model_dump(mode="json", by_alias=True)
+                yield SSEManager.encode_event("done", data)
+                return
+
+            async for text in stream_gemini(contents, mime_type):
+                chunks.append(text)
+                yield SSEManager.encode_event("token", {"t": text})
+
+            # 누적된 토큰으로 최종 JSON 파싱
+            raw = "".join(chunks).encode("utf-8")
+            result = VisionResult.model_validate_json(raw)
+            await store_result(cache_key, result, raw)
+            data = build_response_data(result).model_dump(mode="json", by_alias=True)
+            yield SSEManager.encode_event("done", data)
+        except Exception as e:
+            logger.error(f"Gemini Stream Error: {e}")
+            yield SSEManager.encode_event("error", {"message": "AI Analysis Failed"})
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
+        }
+    )
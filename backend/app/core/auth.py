@@ -3,24 +3,53 @@ RBAC (Role-Based Access Control) - 역할 기반 권한 관리 시스템
 """
 
 from enum import Enum
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from functools import wraps
 from fastapi import HTTPException, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 import os
+import time
+import hashlib
+import threading
 from datetime import datetime, timedelta
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # JWT 설정
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-super-secret-key-change-in-production")
-ALGORITHM = "HS256"
+# HS256(기본) 또는 EdDSA(Ed25519 비대칭 키) - EdDSA는 JWT_PRIVATE_KEY/JWT_PUBLIC_KEY(PEM) 필요
+ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
 
+def _load_jwt_keys():
+    """
+    서명/검증 키를 모듈 로드 시 한 번만 준비
+    EdDSA는 PEM을 매 요청마다 파싱하지 않도록 키 객체로 미리 로드
+    """
+    if ALGORITHM != "EdDSA":
+        return SECRET_KEY, SECRET_KEY
+    
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+    
+    # 환경 변수에는 줄바꿈이 \n 으로 이스케이프되어 들어올 수 있음
+    private_pem = os.getenv("JWT_PRIVATE_KEY", "").replace("\\n", "\n").encode()
+    public_pem = os.getenv("JWT_PUBLIC_KEY", "").replace("\\n", "\n").encode()
+    return load_pem_private_key(private_pem, password=None), load_pem_public_key(public_pem)
+
+
+_SIGNING_KEY, _VERIFY_KEY = _load_jwt_keys()
+
+# 디코딩된 토큰 캐시 (같은 토큰을 요청/의존성마다 다시 검증하지 않도록)
+# 키: blake2b(토큰), 값: (TokenPayload, exp 타임스탬프) - 캐시 적중 시에도 만료 여부는 다시 확인
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
 class UserRole(str, Enum):
     """사용자 역할 정의"""
     GUEST = "guest"          # 게스트 (읽기만 가능)
@@ -104,10 +133,16 @@ ROLE_PERMISSIONS = {
     ],
 }
 
+# 권한 검사용 frozenset (모듈 로드 시 한 번만 생성, 요청마다 set() 재생성 방지)
+ROLE_PERMISSIONS_SET = {role: frozenset(perms) for role, perms in ROLE_PERMISSIONS.items()}
+
 
 class TokenPayload:
     """JWT 토큰 페이로드"""
     
+    # 인스턴스 __dict__ 생성 생략 (요청마다 만들어지는 객체라 메모리/속성 접근 비용 절감)
+    __slots__ = ("user_id", "email", "role", "permissions", "exp", "token_type")
+    
     def __init__(
         self,
         user_id: str,
@@ -120,7 +155,9 @@ class TokenPayload:
         self.user_id = user_id
         self.email = email
         self.role = role
-        self.permissions = permissions or ROLE_PERMISSIONS.get(role, [])
+        self.permissions: FrozenSet[Permission] = (
+            frozenset(permissions) if permissions else ROLE_PERMISSIONS_SET.get(role, frozenset())
+        )
         self.exp = exp
         self.token_type = token_type
     
@@ -129,7 +166,7 @@ class TokenPayload:
             "user_id": self.user_id,
             "email": self.email,
             "role": self.role.value,
-            "permissions": [p.value for p in self.permissions],
+            "permissions": sorted(p.value for p in self.permissions),
             "exp": self.exp.timestamp() if self.exp else None,
             "token_type": self.token_type
         }
@@ -160,7 +197,7 @@ class TokenService:
             exp=exp,
             token_type="access"
         )
-        return jwt.encode(payload.to_dict(), SECRET_KEY, algorithm=ALGORITHM)
+        return jwt.encode(payload.to_dict(), _SIGNING_KEY, algorithm=ALGORITHM)
     
     @staticmethod
     def create_refresh_token(user_id: str, email: str, role: UserRole) -> str:
@@ -173,7 +210,7 @@ class TokenService:
             exp=exp,
             token_type="refresh"
         )
-        return jwt.encode(payload.to_dict(), SECRET_KEY, algorithm=ALGORITHM)
+        return jwt.encode(payload.to_dict(), _SIGNING_KEY, algorithm=ALGORITHM)
     
     @staticmethod
     def create_token_pair(user_id: str, email: str, role: UserRole) -> dict:
@@ -187,10 +224,22 @@ class TokenService:
     
     @staticmethod
     def decode_token(token: str) -> Optional[TokenPayload]:
-        """토큰 디코딩 및 검증"""
+        """토큰 디코딩 및 검증 (검증된 토큰은 짧게 캐싱)"""
+        # 원본 토큰 대신 해시를 키로 사용 (메모리에 토큰 문자열을 남기지 않음)
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(key)
+        if cached is not None:
+            payload, exp = cached
+            if exp is None or exp > time.time():
+                return payload
+        
         try:
-            data = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            return TokenPayload.from_dict(data)
+            data = jwt.decode(token, _VERIFY_KEY, algorithms=[ALGORITHM])
+            payload = TokenPayload.from_dict(data)
+            with _TOKEN_CACHE_LOCK:
+                _TOKEN_CACHE[key] = (payload, data.get("exp"))
+            return payload
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=401, detail="토큰이 만료되었습니다.")
         except jwt.InvalidTokenError:
@@ -286,6 +335,8 @@ def require_permission(permissions: List[Permission]):
     async def ai_analysis(current_user: TokenPayload = Depends(get_current_user_required)):
         ...
     """
+    required_permissions = frozenset(permissions)
+    
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -300,14 +351,11 @@ def require_permission(permissions: List[Permission]):
                 raise HTTPException(status_code=401, detail="인증이 필요합니다.")
             
             # 필요한 권한 확인
-            user_permissions = set(current_user.permissions)
-            required_permissions = set(permissions)
-            
-            if not required_permissions.issubset(user_permissions):
-                missing = required_permissions - user_permissions
+            if not required_permissions <= current_user.permissions:
+                missing = required_permissions - current_user.permissions
                 raise HTTPException(
                     status_code=403, 
-                    detail=f"권한이 부족합니다. 필요한 권한: {[p.value for p in missing]}"
+                    detail=f"권한이 부족합니다. 필요한 권한: {sorted(p.value for p in missing)}"
                 )
             
             return await func(*args, **kwargs)
@@ -334,6 +382,7 @@ class RBACChecker:
     ):
         self.roles = roles or []
         self.permissions = permissions or []
+        self._required = frozenset(self.permissions)
     
     async def __call__(
         self, 
@@ -352,15 +401,12 @@ class RBACChecker:
             )
         
         # 권한 확인
-        if self.permissions:
-            user_permissions = set(payload.permissions)
-            required = set(self.permissions)
-            if not required.issubset(user_permissions):
-                missing = required - user_permissions
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"권한이 부족합니다. 필요한 권한: {[p.value for p in missing]}"
-                )
+        if not self._required <= payload.permissions:
+            missing = self._required - payload.permissions
+            raise HTTPException(
+                status_code=403,
+                detail=f"권한이 부족합니다. 필요한 권한: {sorted(p.value for p in missing)}"
+            )
         
         return payload
 
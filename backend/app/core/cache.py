@@ -4,32 +4,51 @@ Redis 캐싱 서비스
 """
 
 import os
-import json
+import re
+import time
+import asyncio
+from string import Formatter
 from datetime import datetime, timedelta
 from typing import Optional, Any, List
 from functools import wraps
+import orjson
 import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
 
 load_dotenv()
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# orjson 직렬화 옵션 (기존 json.dumps(default=str) 결과와 호환)
+# - datetime은 default=str로 넘겨 기존과 같은 문자열 형식 유지
+# - int 등 문자열이 아닌 dict 키 허용
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+# Redis 커넥션 풀 최대 연결 수
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+
 # Redis 클라이언트 (싱글톤)
 _redis_client: Optional[redis.Redis] = None
 
+# 커넥션 풀 (모듈 로드 시 한 번 생성, 연결은 필요할 때 열고 재사용)
+# 값은 bytes 그대로 받아 orjson으로 바로 파싱 (decode_responses 미사용)
+_redis_pool = redis.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=REDIS_MAX_CONNECTIONS,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
 
 def get_redis_client() -> redis.Redis:
     """Redis 클라이언트 인스턴스 반환"""
     global _redis_client
     if _redis_client is None:
         try:
-            _redis_client = redis.from_url(
-                REDIS_URL,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-            )
+            _redis_client = redis.Redis(connection_pool=_redis_pool)
             # 연결 테스트
             _redis_client.ping()
         except redis.ConnectionError:
@@ -59,31 +78,137 @@ class CacheKeys:
     # AI 분석 결과 (가용 시간)
     AVAILABLE_TIME = "ai:available_time:{user_id}:{date_range}"
     
+    # 이미지 분석 결과 (이미지 내용 해시별)
+    VISION_RESULT = "ai:vision:{digest}"
+    
+    # 일괄 분석 대기 중인 업로드 이미지 bytes (Celery 메시지에는 키만 전달)
+    VISION_UPLOAD = "ai:vision:upload:{upload_id}"
+    
     # 작업 상태
     TASK_STATUS = "task:status:{task_id}"
 
 
-class CacheService:
-    """캐싱 서비스 클래스"""
+class _BaseCacheService:
+    """
+    동기/비동기 캐싱 서비스 공통 부분
+    TTL, 캐시 키 생성, 직렬화, Redis 상태 관리만 담당 (Redis 호출은 하위 클래스에서)
+    """
     
     # 기본 TTL (초)
     DEFAULT_TTL = 300  # 5분
     SHORT_TTL = 60     # 1분
     LONG_TTL = 3600    # 1시간
+    NOTIFICATION_TTL = 30  # 30초
+    
+    # Redis 상태 확인(PING) 간격 (초) - 매 캐시 작업마다 PING 왕복하지 않도록
+    HEALTH_CHECK_INTERVAL = 2.0
+    
+    # SCAN 한 번에 훑을 키 수 (KEYS 처럼 Redis 전체를 한 번에 막지 않도록 나눠서 조회)
+    SCAN_COUNT = 500
+    
+    def __init__(self, client, checked: bool):
+        """checked: 생성 시점에 이미 연결을 확인했는지 (아니면 첫 사용 때 PING)"""
+        self.client = client
+        self._healthy = client is not None
+        self._last_check = time.monotonic() if checked else float("-inf")
+    
+    # ---------------------------------------------------------
+    # Redis 상태 관리
+    # ---------------------------------------------------------
+    
+    def _needs_health_check(self) -> bool:
+        """마지막 확인 후 HEALTH_CHECK_INTERVAL이 지났는지"""
+        return time.monotonic() - self._last_check >= self.HEALTH_CHECK_INTERVAL
+    
+    def _record_health(self, healthy: bool) -> bool:
+        """상태 확인 결과 기록"""
+        self._healthy = healthy
+        self._last_check = time.monotonic()
+        return healthy
+    
+    def _mark_unhealthy(self):
+        """명령 실패 시 다음 상태 확인 전까지 Redis 사용 중단"""
+        self._record_health(False)
+    
+    def _handle_error(self, action: str, e: Exception):
+        """캐시 명령 실패 처리 (Redis 오류면 사용 중단 표시 후 로그)"""
+        if isinstance(e, redis.RedisError):
+            self._mark_unhealthy()
+        print(f"Cache {action} error: {e}")
+    
+    # ---------------------------------------------------------
+    # 직렬화
+    # ---------------------------------------------------------
+    
+    @staticmethod
+    def _dumps(value: Any, raw: Optional[bytes] = None) -> bytes:
+        """저장할 값 직렬화 (이미 직렬화된 JSON bytes가 있으면 그대로 사용)"""
+        if raw is not None:
+            return raw
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+    
+    @staticmethod
+    def _loads(data: Optional[bytes]) -> Optional[Any]:
+        """조회한 값 역직렬화 (없으면 None)"""
+        return orjson.loads(data) if data else None
+    
+    # ---------------------------------------------------------
+    # 캐시 키
+    # ---------------------------------------------------------
+    
+    @staticmethod
+    def _notifications_key(user_id: str) -> str:
+        return CacheKeys.PENDING_NOTIFICATIONS.format(user_id=user_id)
+    
+    @staticmethod
+    def _lectures_key(user_id: str) -> str:
+        return CacheKeys.LECTURES.format(user_id=user_id)
+    
+    @staticmethod
+    def _lectures_by_date_pattern(user_id: str) -> str:
+        return f"lectures:{user_id}:*"
+    
+    @staticmethod
+    def _vision_result_key(digest: str) -> str:
+        return CacheKeys.VISION_RESULT.format(digest=digest)
+    
+    @staticmethod
+    def _vision_upload_key(upload_id: str) -> str:
+        return CacheKeys.VISION_UPLOAD.format(upload_id=upload_id)
+    
+    @staticmethod
+    def _task_status_key(task_id: str) -> str:
+        return CacheKeys.TASK_STATUS.format(task_id=task_id)
+    
+    @staticmethod
+    def _user_cache_patterns(user_id: str) -> List[str]:
+        """특정 사용자의 캐시 키 패턴 목록"""
+        return [
+            f"schedules:*:{user_id}",
+            f"notifications:*:{user_id}",
+            f"lectures:{user_id}",
+            f"ai:*:{user_id}:*",
+        ]
+
+
+class CacheService(_BaseCacheService):
+    """캐싱 서비스 클래스"""
     
     def __init__(self):
-        self.client = get_redis_client()
+        super().__init__(get_redis_client(), checked=True)
     
     @property
     def is_available(self) -> bool:
-        """Redis 사용 가능 여부"""
+        """Redis 사용 가능 여부 (HEALTH_CHECK_INTERVAL 동안은 마지막 확인 결과 재사용)"""
         if self.client is None:
             return False
+        if not self._needs_health_check():
+            return self._healthy
         try:
             self.client.ping()
-            return True
-        except:
-            return False
+            return self._record_health(True)
+        except Exception:
+            return self._record_health(False)
     
     def get(self, key: str) -> Optional[Any]:
         """캐시 조회"""
@@ -91,28 +216,34 @@ class CacheService:
             return None
         
         try:
-            data = self.client.get(key)
-            if data:
-                return json.loads(data)
-            return None
+            return self._loads(self.client.get(key))
         except Exception as e:
-            print(f"Cache get error: {e}")
+            self._handle_error("get", e)
             return None
     
-    def set(self, key: str, value: Any, ttl: int = None) -> bool:
-        """캐시 저장"""
+    def set(self, key: str, value: Any = None, ttl: int = None, *, raw: Optional[bytes] = None) -> bool:
+        """캐시 저장 (이미 직렬화된 JSON bytes가 있으면 raw로 넘겨 재직렬화 생략)"""
         if not self.is_available:
             return False
         
         try:
-            ttl = ttl or self.DEFAULT_TTL
-            serialized = json.dumps(value, default=str)
-            self.client.setex(key, ttl, serialized)
+            self.client.setex(key, ttl or self.DEFAULT_TTL, self._dumps(value, raw))
             return True
         except Exception as e:
-            print(f"Cache set error: {e}")
+            self._handle_error("set", e)
             return False
     
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """캐시 조회 (역직렬화 없이 bytes 그대로)"""
+        if not self.is_available:
+            return None
+        
+        try:
+            return self.client.get(key)
+        except Exception as e:
+            self._handle_error("get", e)
+            return None
+    
     def delete(self, key: str) -> bool:
         """캐시 삭제"""
         if not self.is_available:
@@ -122,33 +253,53 @@ class CacheService:
             self.client.delete(key)
             return True
         except Exception as e:
-            print(f"Cache delete error: {e}")
+            self._handle_error("delete", e)
             return False
     
+    def _queue_unlink_pattern(self, pipe, pattern: str) -> int:
+        """패턴에 맞는 키를 SCAN으로 찾아 파이프라인에 UNLINK(비동기 삭제) 예약"""
+        queued = 0
+        batch = []
+        for key in self.client.scan_iter(match=pattern, count=self.SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= self.SCAN_COUNT:
+                pipe.unlink(*batch)
+                queued += len(batch)
+                batch = []
+        if batch:
+            pipe.unlink(*batch)
+            queued += len(batch)
+        return queued
+    
     def delete_pattern(self, pattern: str) -> int:
         """패턴에 맞는 모든 키 삭제"""
         if not self.is_available:
             return 0
         
         try:
-            keys = self.client.keys(pattern)
-            if keys:
-                return self.client.delete(*keys)
+            pipe = self.client.pipeline(transaction=False)
+            queued = self._queue_unlink_pattern(pipe, pattern)
+            if queued:
+                return sum(pipe.execute())
             return 0
         except Exception as e:
-            print(f"Cache delete pattern error: {e}")
+            self._handle_error("delete pattern", e)
             return 0
     
     def invalidate_user_cache(self, user_id: str):
-        """특정 사용자의 모든 캐시 무효화"""
-        patterns = [
-            f"schedules:*:{user_id}",
-            f"notifications:*:{user_id}",
-            f"lectures:{user_id}",
-            f"ai:*:{user_id}:*",
-        ]
-        for pattern in patterns:
-            self.delete_pattern(pattern)
+        """특정 사용자의 모든 캐시 무효화 (삭제는 파이프라인 한 번으로 전송)"""
+        if not self.is_available:
+            return
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            queued = 0
+            for pattern in self._user_cache_patterns(user_id):
+                queued += self._queue_unlink_pattern(pipe, pattern)
+            if queued:
+                pipe.execute()
+        except Exception as e:
+            self._handle_error("invalidate", e)
     
     # =========================================================
     # 일정 관련 캐시
@@ -180,18 +331,15 @@ class CacheService:
     
     def get_pending_notifications(self, user_id: str) -> Optional[List]:
         """대기 중인 알림 캐시 조회"""
-        key = CacheKeys.PENDING_NOTIFICATIONS.format(user_id=user_id)
-        return self.get(key)
+        return self.get(self._notifications_key(user_id))
     
     def set_pending_notifications(self, user_id: str, notifications: List) -> bool:
         """대기 중인 알림 캐시 저장 (짧은 TTL)"""
-        key = CacheKeys.PENDING_NOTIFICATIONS.format(user_id=user_id)
-        return self.set(key, notifications, 30)  # 30초
+        return self.set(self._notifications_key(user_id), notifications, self.NOTIFICATION_TTL)
     
     def invalidate_notifications(self, user_id: str):
         """알림 캐시 무효화"""
-        key = CacheKeys.PENDING_NOTIFICATIONS.format(user_id=user_id)
-        self.delete(key)
+        self.delete(self._notifications_key(user_id))
     
     # =========================================================
     # 강의 관련 캐시
@@ -199,21 +347,16 @@ class CacheService:
     
     def get_lectures(self, user_id: str) -> Optional[List]:
         """강의 시간표 캐시 조회"""
-        key = CacheKeys.LECTURES.format(user_id=user_id)
-        return self.get(key)
+        return self.get(self._lectures_key(user_id))
     
     def set_lectures(self, user_id: str, lectures: List) -> bool:
         """강의 시간표 캐시 저장 (긴 TTL)"""
-        key = CacheKeys.LECTURES.format(user_id=user_id)
-        return self.set(key, lectures, self.LONG_TTL)
+        return self.set(self._lectures_key(user_id), lectures, self.LONG_TTL)
     
     def invalidate_lectures(self, user_id: str):
         """강의 캐시 무효화 (날짜별 캐시 포함)"""
-        # 기본 강의 캐시
-        key = CacheKeys.LECTURES.format(user_id=user_id)
-        self.delete(key)
-        # 날짜별 강의 캐시도 무효화
-        self.delete_pattern(f"lectures:{user_id}:*")
+        self.delete(self._lectures_key(user_id))
+        self.delete_pattern(self._lectures_by_date_pattern(user_id))
     
     # =========================================================
     # AI 분석 결과 캐시
@@ -231,43 +374,215 @@ class CacheService:
         key = CacheKeys.AVAILABLE_TIME.format(user_id=user_id, date_range=date_range)
         return self.set(key, result, self.DEFAULT_TTL)
     
+    def get_vision_result(self, digest: str) -> Optional[dict]:
+        """이미지 분석 결과 캐시 조회"""
+        return self.get(self._vision_result_key(digest))
+    
+    def set_vision_result(self, digest: str, result: dict = None, *, raw: Optional[bytes] = None) -> bool:
+        """이미지 분석 결과 캐시 저장 (긴 TTL)"""
+        return self.set(self._vision_result_key(digest), result, self.LONG_TTL, raw=raw)
+    
+    def get_vision_upload(self, upload_id: str) -> Optional[bytes]:
+        """일괄 분석용 업로드 이미지 bytes 조회"""
+        return self.get_raw(self._vision_upload_key(upload_id))
+    
+    def delete_vision_upload(self, upload_id: str) -> bool:
+        """처리가 끝난 업로드 이미지 삭제"""
+        return self.delete(self._vision_upload_key(upload_id))
+    
     # =========================================================
     # 작업 상태 캐시
     # =========================================================
     
     def get_task_status(self, task_id: str) -> Optional[dict]:
         """비동기 작업 상태 조회"""
-        key = CacheKeys.TASK_STATUS.format(task_id=task_id)
-        return self.get(key)
+        return self.get(self._task_status_key(task_id))
     
     def set_task_status(self, task_id: str, status: dict) -> bool:
         """비동기 작업 상태 저장"""
-        key = CacheKeys.TASK_STATUS.format(task_id=task_id)
-        return self.set(key, status, self.LONG_TTL)
+        return self.set(self._task_status_key(task_id), status, self.LONG_TTL)
 
 
 # 싱글톤 인스턴스
 cache_service = CacheService()
 
 
+# =========================================================
+# 비동기 캐싱 서비스 (async 엔드포인트용)
+# =========================================================
+
+# asyncio용 커넥션 풀 (동기 풀과 별도 - 이벤트 루프에서 소켓을 직접 다룸)
+_async_redis_pool = aioredis.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=REDIS_MAX_CONNECTIONS,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
+
+class AsyncCacheService(_BaseCacheService):
+    """
+    redis.asyncio 기반 캐싱 서비스
+    async def 엔드포인트에서 Redis 왕복 동안 이벤트 루프를 막지 않도록 await로 사용
+    (Celery 태스크 등 동기 코드는 기존 cache_service 사용)
+    """
+    
+    def __init__(self):
+        super().__init__(aioredis.Redis(connection_pool=_async_redis_pool), checked=False)
+    
+    async def is_available(self) -> bool:
+        """Redis 사용 가능 여부 (HEALTH_CHECK_INTERVAL 동안은 마지막 확인 결과 재사용)"""
+        if not self._needs_health_check():
+            return self._healthy
+        try:
+            await self.client.ping()
+            return self._record_health(True)
+        except Exception:
+            return self._record_health(False)
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시 조회"""
+        if not await self.is_available():
+            return None
+        
+        try:
+            return self._loads(await self.client.get(key))
+        except Exception as e:
+            self._handle_error("get", e)
+            return None
+    
+    async def set(self, key: str, value: Any = None, ttl: int = None, *, raw: Optional[bytes] = None) -> bool:
+        """캐시 저장 (이미 직렬화된 JSON bytes가 있으면 raw로 넘겨 재직렬화 생략)"""
+        if not await self.is_available():
+            return False
+        
+        try:
+            await self.client.setex(key, ttl or self.DEFAULT_TTL, self._dumps(value, raw))
+            return True
+        except Exception as e:
+            self._handle_error("set", e)
+            return False
+    
+    async def delete(self, key: str) -> bool:
+        """캐시 삭제"""
+        if not await self.is_available():
+            return False
+        
+        try:
+            await self.client.delete(key)
+            return True
+        except Exception as e:
+            self._handle_error("delete", e)
+            return False
+    
+    async def delete_pattern(self, pattern: str) -> int:
+        """패턴에 맞는 모든 키 삭제 (SCAN + 파이프라인 UNLINK)"""
+        if not await self.is_available():
+            return 0
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            queued = 0
+            async for key in self.client.scan_iter(match=pattern, count=self.SCAN_COUNT):
+                pipe.unlink(key)
+                queued += 1
+            if queued:
+                return sum(await pipe.execute())
+            return 0
+        except Exception as e:
+            self._handle_error("delete pattern", e)
+            return 0
+    
+    # 알림
+    async def get_pending_notifications(self, user_id: str) -> Optional[List]:
+        """대기 중인 알림 캐시 조회"""
+        return await self.get(self._notifications_key(user_id))
+    
+    async def set_pending_notifications(self, user_id: str, notifications: List) -> bool:
+        """대기 중인 알림 캐시 저장 (짧은 TTL)"""
+        return await self.set(self._notifications_key(user_id), notifications, self.NOTIFICATION_TTL)
+    
+    async def invalidate_notifications(self, user_id: str):
+        """알림 캐시 무효화"""
+        await self.delete(self._notifications_key(user_id))
+    
+    # 강의
+    async def invalidate_lectures(self, user_id: str):
+        """강의 캐시 무효화 (날짜별 캐시 포함)"""
+        await self.delete(self._lectures_key(user_id))
+        await self.delete_pattern(self._lectures_by_date_pattern(user_id))
+    
+    # 이미지 분석 결과
+    async def get_vision_result(self, digest: str) -> Optional[dict]:
+        """이미지 분석 결과 캐시 조회"""
+        return await self.get(self._vision_result_key(digest))
+    
+    async def set_vision_result(self, digest: str, result: dict = None, *, raw: Optional[bytes] = None) -> bool:
+        """이미지 분석 결과 캐시 저장 (긴 TTL)"""
+        return await self.set(self._vision_result_key(digest), result, self.LONG_TTL, raw=raw)
+    
+    async def set_vision_upload(self, upload_id: str, image_bytes: bytes, ttl: int) -> bool:
+        """일괄 분석용 업로드 이미지 bytes 저장 (짧은 TTL, 워커가 꺼내 쓴 뒤 삭제)"""
+        return await self.set(self._vision_upload_key(upload_id), ttl=ttl, raw=image_bytes)
+    
+    # 작업 상태
+    async def get_task_status(self, task_id: str) -> Optional[dict]:
+        """비동기 작업 상태 조회"""
+        return await self.get(self._task_status_key(task_id))
+
+
+# 싱글톤 인스턴스 (async)
+async_cache_service = AsyncCacheService()
+
+
 # =========================================================
 # 캐시 데코레이터
 # =========================================================
 
 def cached(key_template: str, ttl: int = CacheService.DEFAULT_TTL):
     """
-    함수 결과를 캐싱하는 데코레이터
+    함수 결과를 캐싱하는 데코레이터 (async 함수면 async_cache_service 사용)
     
     사용법:
     @cached("schedules:today:{user_id}", ttl=60)
     def get_today_schedules(user_id: str):
         ...
     """
+    # 키 템플릿은 데코레이터 적용 시 한 번만 파싱 (호출마다 format 문법 해석 방지)
+    # "{user.id}", "{ids[0]}" 같은 필드는 첫 이름(user, ids)만 인자에서 꺼내고 나머지는 format에 맡김
+    key_fields = tuple(dict.fromkeys(
+        re.split(r"[.\[]", name, maxsplit=1)[0]
+        for _, name, _, _ in Formatter().parse(key_template) if name
+    ))
+    key_format = key_template.format_map
+    
+    def build_key(kwargs: dict) -> str:
+        return key_format({name: kwargs[name] for name in key_fields})
+    
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = build_key(kwargs)
+                
+                cached_result = await async_cache_service.get(cache_key)
+                if cached_result is not None:
+                    return cached_result
+                
+                result = await func(*args, **kwargs)
+                
+                if result is not None:
+                    await async_cache_service.set(cache_key, result, ttl)
+                
+                return result
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # 캐시 키 생성
-            cache_key = key_template.format(**kwargs)
+            cache_key = build_key(kwargs)
             
             # 캐시 조회
             cached_result = cache_service.get(cache_key)
@@ -4,11 +4,33 @@ Celery 애플리케이션 설정
 """
 
 import os
+
+# 워커 풀 종류: prefork(기본, CPU 작업) / gevent(Gemini·Redis 호출 위주의 I/O 작업) / threads
+# 워커 프로세스에만 설정할 것 (API 서버에서 gevent 패치가 적용되지 않도록)
+CELERY_WORKER_POOL = os.getenv("CELERY_WORKER_POOL", "prefork")
+
+if CELERY_WORKER_POOL == "gevent":
+    # 소켓 등을 사용하는 모듈이 import 되기 전에 패치해야 함
+    from gevent import monkey
+    monkey.patch_all()
+    
+    # google-generativeai는 gRPC(C-core)를 쓰므로 monkey patch만으로는 양보하지 않음
+    # gRPC를 gevent 루프에 연결해야 Gemini 호출 중에도 다른 그린렛이 실행됨
+    import grpc.experimental.gevent as grpc_gevent
+    grpc_gevent.init_gevent()
+
 from celery import Celery
+from celery.signals import worker_process_shutdown, worker_shutdown
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# 워커 동시 실행 수 (gevent는 그린렛이라 훨씬 크게 잡아도 됨)
+CELERY_WORKER_CONCURRENCY = int(os.getenv(
+    "CELERY_WORKER_CONCURRENCY",
+    "200" if CELERY_WORKER_POOL == "gevent" else "4"
+))
+
 # Celery 브로커 및 결과 백엔드 설정
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/1")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/2")
@@ -26,10 +48,25 @@ celery_app = Celery(
 
 # Celery 설정
 celery_app.conf.update(
-    # 작업 직렬화 형식
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # 작업 직렬화 형식 (msgpack: json보다 작고 빠름, 배포 중 json 메시지도 수용)
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
+    
+    # 큰 인자(일괄 분석 이미지 등)와 결과는 압축해서 전송
+    task_compression="gzip",
+    result_compression="gzip",
+    
+    # 브로커/결과 백엔드 Redis 연결 재사용
+    broker_transport_options={
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+        "max_connections": 64,
+    },
+    result_backend_transport_options={
+        "max_connections": 64,
+    },
     
     # 타임존 설정
     timezone="Asia/Seoul",
@@ -42,8 +79,9 @@ celery_app.conf.update(
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     
-    # 동시 실행 워커 수 (프로세스 당)
-    worker_concurrency=4,
+    # 워커 풀 및 동시 실행 수 (프로세스 당)
+    worker_pool=CELERY_WORKER_POOL,
+    worker_concurrency=CELERY_WORKER_CONCURRENCY,
     
     # 작업 시간 제한 (5분)
     task_time_limit=300,
@@ -64,6 +102,19 @@ celery_app.conf.update(
     },
 )
 
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _drain_event_batcher(**kwargs):
+    """
+    워커 종료 시 emit_* 버퍼에 남은 이벤트 발행 (FastAPI lifespan의 drain과 같은 역할)
+    prefork는 자식 프로세스마다 worker_process_shutdown, gevent/solo는 worker_shutdown에서 실행
+    """
+    from app.core.event_bus import event_batcher
+    event_batcher.drain()
+
+
 # 주기적 작업 (Celery Beat) - 필요시 활성화
 # celery_app.conf.beat_schedule = {
 #     "check-pending-notifications": {
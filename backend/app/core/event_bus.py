@@ -5,19 +5,31 @@ DB 부하 감소 및 즉시 알림 전달
 """
 
 import os
-import json
+import time
+import queue as _queue
 import asyncio
+import inspect
+import logging
 import threading
 from datetime import datetime
-from typing import Optional, Callable, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Callable, Dict, Any, List, Set
 from enum import Enum
+import msgpack
+import orjson
 import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# SSE 연결당 대기 이벤트 최대 개수 (초과분은 버림)
+SSE_QUEUE_MAXSIZE = int(os.getenv("SSE_QUEUE_MAXSIZE", "100"))
+
 
 class EventType(str, Enum):
     """이벤트 타입 정의"""
@@ -46,6 +58,23 @@ class EventType(str, Enum):
     DEADLINE_ALERT = "system:deadline_alert"
 
 
+# 이벤트 타입 -> 글로벌 채널 (발행마다 문자열 포맷/인코딩하지 않도록 미리 계산)
+_GLOBAL_CHANNELS: Dict[EventType, bytes] = {
+    et: f"events:{et.value}".encode() for et in EventType
+}
+
+# 글로벌 이벤트 채널 -> 이벤트 타입 (pubsub 메시지의 channel은 bytes)
+_CHANNEL_EVENT_TYPES: Dict[bytes, EventType] = {
+    channel: et for et, channel in _GLOBAL_CHANNELS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _user_channel(user_id: str) -> bytes:
+    """사용자별 채널 이름 (자주 쓰이는 사용자 ID는 캐시)"""
+    return f"events:user:{user_id}".encode()
+
+
 class EventPayload:
     """이벤트 페이로드 구조"""
     
@@ -110,34 +139,59 @@ class EventBus:
         self._initialized = True
         self._handlers: Dict[EventType, List[Callable]] = {}
         self._pubsub = None
-        self._listener_thread = None
+        self._listener_task: Optional[asyncio.Task] = None
         self._running = False
+        self._available = False
+        self._reconnect_thread = None
         
-        # Redis 연결
+        # Redis 연결 (메시지는 msgpack bytes 그대로 주고받음)
         try:
             self._redis = redis.from_url(
                 REDIS_URL,
-                decode_responses=True,
                 socket_connect_timeout=5,
                 socket_timeout=5,
             )
             self._redis.ping()
-            print("✅ EventBus: Redis 연결 성공")
+            self._available = True
+            logger.info("EventBus: Redis 연결 성공")
         except redis.ConnectionError:
-            print("⚠️ EventBus: Redis 연결 실패")
+            logger.warning("EventBus: Redis 연결 실패")
             self._redis = None
     
+    # 연결이 끊겼을 때 재연결 확인(PING) 간격 (초)
+    RECONNECT_INTERVAL = 5.0
+    
     @property
     def is_available(self) -> bool:
-        """Redis 사용 가능 여부"""
+        """Redis 사용 가능 여부 (PING 없이 마지막 상태 플래그 반환)"""
+        return self._redis is not None and self._available
+    
+    def health_check_ping(self) -> bool:
+        """실제 PING으로 Redis 상태 확인 (헬스 체크 엔드포인트 전용)"""
         if self._redis is None:
             return False
         try:
             self._redis.ping()
             return True
-        except:
+        except Exception:
             return False
     
+    def _mark_unavailable(self):
+        """발행 실패 시 사용 불가로 표시하고 백그라운드에서 재연결 시도"""
+        self._available = False
+        with self._lock:
+            if self._reconnect_thread is None or not self._reconnect_thread.is_alive():
+                self._reconnect_thread = threading.Thread(target=self._reconnect, daemon=True)
+                self._reconnect_thread.start()
+    
+    def _reconnect(self):
+        """RECONNECT_INTERVAL마다 PING 해서 복구되면 다시 사용 가능으로 전환"""
+        while not self._available:
+            time.sleep(self.RECONNECT_INTERVAL)
+            if self.health_check_ping():
+                self._available = True
+                logger.info("EventBus: Redis 재연결 성공")
+    
     def publish(self, event_type: EventType, user_id: str, data: Dict[str, Any]) -> bool:
         """
         이벤트 발행
@@ -154,103 +208,224 @@ class EventBus:
             return False
         
         try:
-            payload = EventPayload(event_type, user_id, data)
+            pipe = self._redis.pipeline(transaction=False)
+            self._queue_publish(pipe, event_type, user_id, data)
+            pipe.execute()
             
-            # 글로벌 채널에 발행
-            channel = f"events:{event_type.value}"
-            self._redis.publish(channel, json.dumps(payload.to_dict()))
-            
-            # 사용자별 채널에도 발행 (개인화된 알림용)
-            user_channel = f"events:user:{user_id}"
-            self._redis.publish(user_channel, json.dumps(payload.to_dict()))
-            
-            print(f"📤 Event published: {event_type.value} -> user:{user_id}")
+            logger.debug("Event published: %s -> user:%s", event_type.value, user_id)
             return True
         except Exception as e:
-            print(f"❌ Event publish error: {e}")
+            if isinstance(e, (redis.ConnectionError, redis.TimeoutError)):
+                self._mark_unavailable()
+            logger.warning("Event publish error: %s", e)
             return False
     
+    def publish_many(self, events: List[tuple]) -> int:
+        """
+        여러 이벤트를 파이프라인 한 번으로 발행
+        
+        Args:
+            events: (event_type, user_id, data) 튜플 목록
+        
+        Returns:
+            발행한 이벤트 수
+        """
+        if not events or not self.is_available:
+            return 0
+        
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for event_type, user_id, data in events:
+                self._queue_publish(pipe, event_type, user_id, data)
+            pipe.execute()
+            
+            logger.debug("Events published: %d", len(events))
+            return len(events)
+        except Exception as e:
+            if isinstance(e, (redis.ConnectionError, redis.TimeoutError)):
+                self._mark_unavailable()
+            logger.warning("Event publish error: %s", e)
+            return 0
+    
+    def _queue_publish(self, pipe, event_type: EventType, user_id: str, data: Dict[str, Any]):
+        """파이프라인에 글로벌 채널 + 사용자별 채널(개인화된 알림용) PUBLISH 예약"""
+        payload = EventPayload(event_type, user_id, data)
+        # 한 번만 직렬화해서 두 채널에 같은 bytes 재사용
+        message = msgpack.packb(payload.to_dict(), use_bin_type=True)
+        pipe.publish(_GLOBAL_CHANNELS[event_type], message)
+        pipe.publish(_user_channel(user_id), message)
+    
     def subscribe(self, event_type: EventType, handler: Callable[[EventPayload], None]):
         """
         이벤트 구독 (핸들러 등록)
         
         Args:
             event_type: 구독할 이벤트 타입
-            handler: 이벤트 처리 함수
+            handler: 이벤트 처리 함수 (일반 함수 또는 async 함수)
         """
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
-        print(f"📥 Handler registered for: {event_type.value}")
+        logger.debug("Handler registered for: %s", event_type.value)
     
     def unsubscribe(self, event_type: EventType, handler: Callable):
         """이벤트 구독 해제"""
         if event_type in self._handlers:
             self._handlers[event_type].remove(handler)
     
-    def start_listening(self):
-        """백그라운드에서 이벤트 리스닝 시작"""
+    async def start_listening(self):
+        """이벤트 리스닝 시작 (FastAPI 이벤트 루프에서 태스크로 실행)"""
         if not self.is_available or self._running:
             return
         
         self._running = True
-        self._pubsub = self._redis.pubsub()
+        # 구독 전용 비동기 연결은 읽기 타임아웃 없이 소켓에서 대기
+        listener_client = aioredis.from_url(
+            REDIS_URL,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+        )
+        self._pubsub = listener_client.pubsub()
         
-        # 모든 등록된 이벤트 타입에 대해 구독
-        channels = [f"events:{et.value}" for et in EventType]
-        self._pubsub.subscribe(*channels)
+        # 글로벌 이벤트 채널만 구독 (events:* 패턴은 사용자별 채널 events:user:* 까지 받아
+        # 같은 이벤트를 두 번 수신하게 되므로 사용하지 않음)
+        await self._pubsub.subscribe(*_GLOBAL_CHANNELS.values())
         
-        # 백그라운드 스레드에서 리스닝
-        self._listener_thread = threading.Thread(target=self._listen, daemon=True)
-        self._listener_thread.start()
-        print("🎧 EventBus: Started listening...")
+        # 같은 이벤트 루프에서 리스닝 (스레드 → 루프 전달 없이 핸들러를 바로 await)
+        self._listener_task = asyncio.create_task(self._listen())
+        logger.info("EventBus: Started listening")
     
-    def stop_listening(self):
+    async def stop_listening(self):
         """이벤트 리스닝 중지"""
         self._running = False
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
         if self._pubsub:
-            self._pubsub.unsubscribe()
-            self._pubsub.close()
-        print("🛑 EventBus: Stopped listening")
+            await self._pubsub.unsubscribe()
+            await self._pubsub.aclose()
+            self._pubsub = None
+        logger.info("EventBus: Stopped listening")
     
-    def _listen(self):
-        """이벤트 리스닝 루프"""
+    async def _listen(self):
+        """
+        이벤트 리스닝 루프
+        listen()은 메시지가 올 때까지 대기하며,
+        stop_listening()에서 태스크를 취소하면 빠져나옴
+        """
         while self._running:
             try:
-                message = self._pubsub.get_message(timeout=1.0)
-                if message and message["type"] == "message":
-                    self._handle_message(message)
+                async for message in self._pubsub.listen():
+                    if not self._running:
+                        break
+                    if message["type"] == "message":
+                        await self._handle_message(message)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print(f"❌ EventBus listen error: {e}")
+                if not self._running:
+                    break
+                logger.warning("EventBus listen error: %s", e)
+                await asyncio.sleep(1.0)  # 연결 오류 시 재시도 간격
     
-    def _handle_message(self, message: dict):
+    async def _handle_message(self, message: dict):
         """수신된 메시지 처리"""
+        # 채널 이름으로 이벤트 타입 판별
+        event_type = _CHANNEL_EVENT_TYPES.get(message["channel"])
+        if event_type is None:
+            return
+        
         try:
-            data = json.loads(message["data"])
+            data = msgpack.unpackb(message["data"], raw=False)
             payload = EventPayload.from_dict(data)
             
-            # 등록된 핸들러 호출
-            handlers = self._handlers.get(payload.event_type, [])
+            # 등록된 핸들러 호출 (async 핸들러는 바로 await)
+            handlers = self._handlers.get(event_type, [])
             for handler in handlers:
                 try:
-                    handler(payload)
+                    result = handler(payload)
+                    if inspect.isawaitable(result):
+                        await result
                 except Exception as e:
-                    print(f"❌ Handler error: {e}")
+                    logger.warning("Handler error: %s", e)
         except Exception as e:
-            print(f"❌ Message parse error: {e}")
+            logger.warning("Message parse error: %s", e)
 
 
 # 싱글톤 인스턴스
 event_bus = EventBus()
 
 
+class _EventBatcher:
+    """
+    emit_* 헬퍼 이벤트를 잠깐 모았다가 파이프라인 한 번으로 발행하는 버퍼
+    
+    일괄 작업(일일 요약, 대량 일정 등록 등)에서 이벤트마다 Redis 왕복하지 않도록
+    최대 MAX_BATCH개 또는 LINGER_SECONDS 동안 모아서 발행
+    호출부가 동기 코드(Celery 태스크 포함)라 백그라운드 스레드로 동작
+    """
+    
+    MAX_BATCH = 256
+    LINGER_SECONDS = 0.001
+    
+    def __init__(self, bus: EventBus):
+        self._bus = bus
+        self._queue: "_queue.SimpleQueue[tuple]" = _queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, event_type: EventType, user_id: str, data: Dict[str, Any]):
+        """이벤트를 버퍼에 추가 (발행은 백그라운드 스레드가 담당)"""
+        if self._thread is None:
+            self._start()
+        self._queue.put((event_type, user_id, data))
+    
+    def _start(self):
+        # 처음 사용할 때 시작 (Celery prefork 워커에서는 fork 이후에 스레드가 생성되도록)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="event-batcher")
+                self._thread.start()
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.LINGER_SECONDS
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except _queue.Empty:
+                    break
+            self._bus.publish_many(batch)
+    
+    def drain(self):
+        """버퍼에 남은 이벤트를 즉시 발행 (서버 종료 시)"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except _queue.Empty:
+                break
+        self._bus.publish_many(batch)
+
+
+event_batcher = _EventBatcher(event_bus)
+
+
 # =========================================================
 # 이벤트 발행 헬퍼 함수
 # =========================================================
 
 def emit_notification_created(user_id: str, notification_id: str, message: str, notify_at: datetime):
     """알림 생성 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.NOTIFICATION_CREATED,
         user_id,
         {
@@ -263,7 +438,7 @@ def emit_notification_created(user_id: str, notification_id: str, message: str,
 
 def emit_notification_sent(user_id: str, notification_id: str):
     """알림 발송 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.NOTIFICATION_SENT,
         user_id,
         {"notification_id": notification_id}
@@ -272,7 +447,7 @@ def emit_notification_sent(user_id: str, notification_id: str):
 
 def emit_schedule_created(user_id: str, schedule_id: str, title: str, start_at: datetime):
     """일정 생성 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.SCHEDULE_CREATED,
         user_id,
         {
@@ -285,7 +460,7 @@ def emit_schedule_created(user_id: str, schedule_id: str, title: str, start_at:
 
 def emit_schedule_updated(user_id: str, schedule_id: str, title: str):
     """일정 수정 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.SCHEDULE_UPDATED,
         user_id,
         {"schedule_id": schedule_id, "title": title}
@@ -294,7 +469,7 @@ def emit_schedule_updated(user_id: str, schedule_id: str, title: str):
 
 def emit_schedule_deleted(user_id: str, schedule_id: str):
     """일정 삭제 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.SCHEDULE_DELETED,
         user_id,
         {"schedule_id": schedule_id}
@@ -303,7 +478,7 @@ def emit_schedule_deleted(user_id: str, schedule_id: str):
 
 def emit_schedule_reminder(user_id: str, schedule_id: str, title: str, minutes_before: int):
     """일정 리마인더 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.SCHEDULE_REMINDER,
         user_id,
         {
@@ -316,7 +491,7 @@ def emit_schedule_reminder(user_id: str, schedule_id: str, title: str, minutes_b
 
 def emit_deadline_alert(user_id: str, schedule_id: str, title: str, deadline: datetime):
     """마감 알림 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.DEADLINE_ALERT,
         user_id,
         {
@@ -329,7 +504,7 @@ def emit_deadline_alert(user_id: str, schedule_id: str, title: str, deadline: da
 
 def emit_daily_summary(user_id: str, schedule_count: int, task_count: int):
     """일일 요약 이벤트 발행"""
-    event_bus.publish(
+    event_batcher.submit(
         EventType.DAILY_SUMMARY,
         user_id,
         {
@@ -348,57 +523,56 @@ class SSEManager:
     """
     SSE 연결 관리자
     프론트엔드에서 실시간 이벤트를 수신할 수 있도록 지원
+    
+    이벤트는 SSE 프레임(bytes)으로 한 번만 인코딩해서 모든 큐에 그대로 넣음
     """
     
     def __init__(self):
-        self._connections: Dict[str, List[asyncio.Queue]] = {}
+        self._connections: Dict[str, Set[asyncio.Queue]] = {}
     
     def connect(self, user_id: str) -> asyncio.Queue:
         """사용자 SSE 연결"""
-        if user_id not in self._connections:
-            self._connections[user_id] = []
-        
-        queue = asyncio.Queue()
-        self._connections[user_id].append(queue)
-        print(f"🔌 SSE connected: user:{user_id}")
+        queue = asyncio.Queue(maxsize=SSE_QUEUE_MAXSIZE)
+        self._connections.setdefault(user_id, set()).add(queue)
+        logger.debug("SSE connected: user:%s", user_id)
         return queue
     
     def disconnect(self, user_id: str, queue: asyncio.Queue):
         """사용자 SSE 연결 해제"""
-        if user_id in self._connections:
+        queues = self._connections.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._connections[user_id]
+        logger.debug("SSE disconnected: user:%s", user_id)
+    
+    @staticmethod
+    def encode_event(event_type: str, data: Any) -> bytes:
+        """SSE 프레임(event 줄 + data 줄 + 빈 줄) 인코딩"""
+        return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+    
+    @staticmethod
+    def _fanout(queues, frame: bytes) -> None:
+        """큐마다 await 없이 넣기 (가득 찬 큐는 느린 클라이언트로 보고 이벤트 버림)"""
+        for queue in queues:
             try:
-                self._connections[user_id].remove(queue)
-                if not self._connections[user_id]:
-                    del self._connections[user_id]
-            except ValueError:
-                pass
-        print(f"🔌 SSE disconnected: user:{user_id}")
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                logger.warning("SSE queue full, event dropped")
     
     async def send_event(self, user_id: str, event_type: str, data: dict):
         """특정 사용자에게 이벤트 전송"""
-        if user_id not in self._connections:
+        queues = self._connections.get(user_id)
+        if not queues:
             return
         
-        event = {
-            "event": event_type,
-            "data": data,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        for queue in self._connections[user_id]:
-            await queue.put(event)
+        self._fanout(queues, self.encode_event(event_type, data))
     
     async def broadcast(self, event_type: str, data: dict):
         """모든 연결된 사용자에게 이벤트 브로드캐스트"""
-        event = {
-            "event": event_type,
-            "data": data,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        for user_id, queues in self._connections.items():
-            for queue in queues:
-                await queue.put(event)
+        frame = self.encode_event(event_type, data)
+        for queues in self._connections.values():
+            self._fanout(queues, frame)
 
 
 # SSE 매니저 싱글톤
@@ -6,17 +6,20 @@ Prometheus 메트릭 수집 및 모니터링
 - 캐시 히트율
 """
 
+import re
 import time
-from typing import Callable
-from functools import wraps
+import asyncio
+from typing import Callable, Optional
+from functools import wraps, lru_cache
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from prometheus_client import (
     Counter, Histogram, Gauge, Info,
     generate_latest, CONTENT_TYPE_LATEST,
     CollectorRegistry, multiprocess, REGISTRY
 )
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from sqlalchemy import text
 
 
 # =========================================================
@@ -111,35 +114,72 @@ app_info = Info('app', 'Application information')
 # 미들웨어
 # =========================================================
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """HTTP 요청 메트릭 수집 미들웨어"""
+# 경로 정규화 패턴 (모듈 로드 시 1회 컴파일)
+_UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+_NUM_RE = re.compile(r'/\d+')
+
+
+@lru_cache(maxsize=1024)
+def _children(method: str, endpoint: str):
+    """(method, endpoint)별 라벨이 붙은 메트릭 객체 캐시 (요청마다 labels() 조회하지 않도록)"""
+    return (
+        http_requests_in_progress.labels(method=method, endpoint=endpoint),
+        http_request_duration_seconds.labels(method=method, endpoint=endpoint),
+    )
+
+
+class PrometheusMiddleware:
+    """
+    HTTP 요청 메트릭 수집 미들웨어
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        method = request.method
-        path = request.url.path
+    BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현
+    (요청마다 추가 태스크/Request·Response 래핑 없이 send만 감싸서 상태 코드 수집)
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._routes = None
+        # 경로 -> 라우트 템플릿 캐시 (같은 경로는 라우트 테이블을 다시 훑지 않음)
+        self._endpoint_for = lru_cache(maxsize=4096)(self._resolve_endpoint)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        method = scope["method"]
+        path = scope["path"]
         
         # 메트릭 엔드포인트는 제외
         if path == "/metrics":
-            return await call_next(request)
+            return await self.app(scope, receive, send)
         
-        # 경로 정규화 (ID 등 동적 부분 제거)
-        endpoint = self._normalize_path(path)
+        # 라우트 템플릿(/api/lectures/{lecture_id} 등)을 엔드포인트 라벨로 사용
+        if self._routes is None:
+            app = scope.get("app")
+            self._routes = app.routes if app is not None else []
+        endpoint = self._endpoint_for(path)
+        in_progress, duration_hist = _children(method, endpoint)
+        
+        # 응답 시작 메시지에서 상태 코드 수집
+        status = 500
+        
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
         
         # 진행 중 요청 증가
-        http_requests_in_progress.labels(method=method, endpoint=endpoint).inc()
+        in_progress.inc()
         
         # 시간 측정 시작
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            response = await call_next(request)
-            status = response.status_code
-        except Exception as e:
-            status = 500
-            raise
+            await self.app(scope, receive, send_wrapper)
         finally:
             # 소요 시간 기록
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             # 메트릭 기록
             http_requests_total.labels(
@@ -148,26 +188,26 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
                 status=status
             ).inc()
             
-            http_request_duration_seconds.labels(
-                method=method, 
-                endpoint=endpoint
-            ).observe(duration)
+            duration_hist.observe(duration)
             
             # 진행 중 요청 감소
-            http_requests_in_progress.labels(method=method, endpoint=endpoint).dec()
-        
-        return response
+            in_progress.dec()
+    
+    def _resolve_endpoint(self, path: str) -> str:
+        """앱 라우트 테이블에서 경로에 맞는 템플릿 찾기 (매칭되는 라우트가 없으면 정규화)"""
+        for route in self._routes:
+            path_regex = getattr(route, "path_regex", None)
+            if path_regex is not None and path_regex.match(path):
+                return route.path
+        return self._normalize_path(path)
     
     def _normalize_path(self, path: str) -> str:
         """경로 정규화 (UUID 등 동적 부분 제거)"""
-        import re
-        
         # UUID 패턴
-        uuid_pattern = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
-        path = re.sub(uuid_pattern, '{id}', path)
+        path = _UUID_RE.sub('{id}', path)
         
         # 숫자 ID
-        path = re.sub(r'/\d+', '/{id}', path)
+        path = _NUM_RE.sub('/{id}', path)
         
         return path
 
@@ -178,44 +218,46 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
 
 def track_db_query(operation: str, table: str):
     """DB 쿼리 메트릭 데코레이터"""
+    # 라벨이 붙은 메트릭은 데코레이터 적용 시 1회만 조회
+    queries_counter = db_queries_total.labels(operation=operation, table=table)
+    duration_hist = db_query_duration_seconds.labels(operation=operation, table=table)
+    
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
-                duration = time.time() - start_time
-                db_queries_total.labels(operation=operation, table=table).inc()
-                db_query_duration_seconds.labels(
-                    operation=operation, 
-                    table=table
-                ).observe(duration)
+                queries_counter.inc()
+                duration_hist.observe(time.perf_counter() - start_time)
         return wrapper
     return decorator
 
 
 def track_cache_operation(operation: str):
     """캐시 작업 메트릭 데코레이터"""
+    # 라벨이 붙은 메트릭은 데코레이터 적용 시 1회만 조회
+    duration_hist = cache_operation_duration_seconds.labels(operation=operation)
+    if operation == "get":
+        hit_counter = cache_operations_total.labels(operation=operation, result="hit")
+        miss_counter = cache_operations_total.labels(operation=operation, result="miss")
+    else:
+        hit_counter = miss_counter = cache_operations_total.labels(operation=operation, result="success")
+    
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
-            # 히트/미스 판단 (get 작업의 경우)
-            if operation == "get":
-                cache_result = "hit" if result is not None else "miss"
+            # 히트/미스 판단 (get 작업의 경우, 그 외는 success)
+            if result is not None:
+                hit_counter.inc()
             else:
-                cache_result = "success"
-            
-            cache_operations_total.labels(
-                operation=operation, 
-                result=cache_result
-            ).inc()
-            cache_operation_duration_seconds.labels(operation=operation).observe(duration)
+                miss_counter.inc()
+            duration_hist.observe(duration)
             
             return result
         return wrapper
@@ -223,76 +265,61 @@ def track_cache_operation(operation: str):
 
 
 def track_ai_call(model: str, operation: str):
-    """AI API 호출 메트릭 데코레이터"""
+    """AI API 호출 메트릭 데코레이터 (sync/async 함수 모두 지원)"""
+    # 라벨이 붙은 메트릭은 데코레이터 적용 시 1회만 조회
+    success_counter = ai_api_calls_total.labels(model=model, operation=operation, status="success")
+    error_counter = ai_api_calls_total.labels(model=model, operation=operation, status="error")
+    duration_hist = ai_api_duration_seconds.labels(model=model, operation=operation)
+    
+    def _record(ok: bool, start_time: float):
+        (success_counter if ok else error_counter).inc()
+        duration_hist.observe(time.perf_counter() - start_time)
+    
     def decorator(func: Callable):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
-            try:
-                result = await func(*args, **kwargs)
-                return result
-            except Exception as e:
-                status = "error"
-                raise
-            finally:
-                duration = time.time() - start_time
-                ai_api_calls_total.labels(
-                    model=model, 
-                    operation=operation, 
-                    status=status
-                ).inc()
-                ai_api_duration_seconds.labels(
-                    model=model, 
-                    operation=operation
-                ).observe(duration)
-        
-        @wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
-            try:
-                result = func(*args, **kwargs)
-                return result
-            except Exception as e:
-                status = "error"
-                raise
-            finally:
-                duration = time.time() - start_time
-                ai_api_calls_total.labels(
-                    model=model, 
-                    operation=operation, 
-                    status=status
-                ).inc()
-                ai_api_duration_seconds.labels(
-                    model=model, 
-                    operation=operation
-                ).observe(duration)
-        
-        import asyncio
         if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        return sync_wrapper
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                start_time = time.perf_counter()
+                ok = False
+                try:
+                    result = await func(*args, **kwargs)
+                    ok = True
+                    return result
+                finally:
+                    _record(ok, start_time)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start_time = time.perf_counter()
+                ok = False
+                try:
+                    result = func(*args, **kwargs)
+                    ok = True
+                    return result
+                finally:
+                    _record(ok, start_time)
+        return wrapper
     return decorator
 
 
 def track_celery_task(task_name: str):
     """Celery 태스크 메트릭 데코레이터"""
+    # 라벨이 붙은 메트릭은 데코레이터 적용 시 1회만 조회
+    success_counter = celery_tasks_total.labels(task_name=task_name, status="success")
+    error_counter = celery_tasks_total.labels(task_name=task_name, status="error")
+    
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            status = "success"
+            tasks_counter = success_counter
             try:
                 result = func(*args, **kwargs)
                 return result
             except Exception as e:
-                status = "error"
+                tasks_counter = error_counter
                 raise
             finally:
-                celery_tasks_total.labels(
-                    task_name=task_name, 
-                    status=status
-                ).inc()
+                tasks_counter.inc()
         return wrapper
     return decorator
 
@@ -330,9 +357,38 @@ def setup_prometheus(app: FastAPI):
 # 헬스체크
 # =========================================================
 
+# DB 헬스체크 쿼리 및 결과 캐시 (로드밸런서/K8s 프로브가 자주 호출해도 매번 DB 왕복하지 않도록)
+_DB_PROBE = text("SELECT 1")
+HEALTH_CACHE_TTL = 2.0  # 초
+_db_healthy_at = 0.0
+
+
+def _probe_database():
+    """DB 연결 확인 (풀의 커넥션 사용)"""
+    from app.db.database import engine
+    
+    with engine.connect() as conn:
+        conn.execute(_DB_PROBE)
+
+
+async def check_database() -> Optional[str]:
+    """
+    DB 헬스체크 (정상이면 None, 실패 시 에러 메시지)
+    최근 HEALTH_CACHE_TTL초 안에 성공했으면 재사용하고, 쿼리는 스레드에서 실행
+    """
+    global _db_healthy_at
+    if time.monotonic() - _db_healthy_at < HEALTH_CACHE_TTL:
+        return None
+    try:
+        await asyncio.to_thread(_probe_database)
+    except Exception as e:
+        return str(e)
+    _db_healthy_at = time.monotonic()
+    return None
+
+
 async def health_check() -> dict:
     """시스템 헬스체크"""
-    from app.db.database import engine
     from app.core.cache import cache_service
     
     health = {
@@ -342,12 +398,11 @@ async def health_check() -> dict:
     }
     
     # DB 체크
-    try:
-        with engine.connect() as conn:
-            conn.execute("SELECT 1")
+    db_error = await check_database()
+    if db_error is None:
         health["checks"]["database"] = "healthy"
-    except Exception as e:
-        health["checks"]["database"] = f"unhealthy: {str(e)}"
+    else:
+        health["checks"]["database"] = f"unhealthy: {db_error}"
         health["status"] = "unhealthy"
     
     # Redis 체크
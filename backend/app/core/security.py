@@ -5,9 +5,12 @@ JWT 토큰 생성/검증, 비밀번호 해싱
 
 import os
 import re
+import asyncio
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 from passlib.context import CryptContext
+from cachetools import TTLCache
 import jwt
 from dotenv import load_dotenv
 
@@ -22,11 +25,19 @@ REFRESH_TOKEN_EXPIRE_DAYS = 7  # 7일
 # 비밀번호 해싱
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 비밀번호 복잡성 검사 패턴 (모듈 로드 시 1회 컴파일)
+_ALPHA_RE = re.compile(r'[A-Za-z]')
+_DIGIT_RE = re.compile(r'\d')
+
 # 로그인 시도 제한 (메모리 기반 - 실무에서는 Redis 권장)
-login_attempts = {}
 MAX_LOGIN_ATTEMPTS = 5
 LOCKOUT_DURATION_MINUTES = 15
 
+# email -> (attempts, locked_until)
+# 크기 제한 + 마지막 기록 후 LOCKOUT_DURATION_MINUTES 지나면 자동 만료 (공격 시에도 메모리 무한 증가 방지)
+login_attempts: TTLCache = TTLCache(maxsize=100_000, ttl=LOCKOUT_DURATION_MINUTES * 60)
+_login_attempts_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
@@ -38,6 +49,11 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (async 핸들러용 - bcrypt 연산을 스레드에서 실행해 이벤트 루프 블로킹 방지)"""
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
 def validate_password_strength(password: str) -> Tuple[bool, str]:
     """
     비밀번호 복잡성 검증
@@ -48,10 +64,10 @@ def validate_password_strength(password: str) -> Tuple[bool, str]:
     if len(password) < 8:
         return False, "비밀번호는 최소 8자 이상이어야 합니다."
     
-    if not re.search(r'[A-Za-z]', password):
+    if not _ALPHA_RE.search(password):
         return False, "비밀번호에 영문자가 포함되어야 합니다."
     
-    if not re.search(r'\d', password):
+    if not _DIGIT_RE.search(password):
         return False, "비밀번호에 숫자가 포함되어야 합니다."
     
     return True, "OK"
@@ -59,42 +75,24 @@ def validate_password_strength(password: str) -> Tuple[bool, str]:
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰 생성"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({
-        "exp": expire,
-        "type": "access",
-        "iat": datetime.utcnow(),
-    })
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    now = datetime.utcnow()
+    expire = now + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+    to_encode = {**data, "exp": expire, "type": "access", "iat": now}
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
 def create_refresh_token(data: dict) -> str:
     """JWT 리프레시 토큰 생성"""
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    
-    to_encode.update({
-        "exp": expire,
-        "type": "refresh",
-        "iat": datetime.utcnow(),
-    })
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    now = datetime.utcnow()
+    expire = now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {**data, "exp": expire, "type": "refresh", "iat": now}
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
 def decode_access_token(token: str) -> Optional[dict]:
     """JWT 토큰 디코드"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except jwt.ExpiredSignatureError:
-        return None
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.InvalidTokenError:
         return None
 
@@ -104,51 +102,49 @@ def check_login_attempts(email: str) -> Tuple[bool, int]:
     로그인 시도 횟수 확인
     Returns: (is_allowed, remaining_seconds)
     """
-    if email not in login_attempts:
+    with _login_attempts_lock:
+        record = login_attempts.get(email)
+    if record is None:
         return True, 0
     
-    attempts, locked_until = login_attempts[email]
-    
-    # 잠금 해제 시간이 지났으면 초기화
-    if locked_until and datetime.utcnow() > locked_until:
-        del login_attempts[email]
+    _, locked_until = record
+    if not locked_until:
         return True, 0
     
-    # 잠금 상태 확인
-    if locked_until:
-        remaining = int((locked_until - datetime.utcnow()).total_seconds())
-        return False, remaining
-    
-    return True, 0
+    # 잠금 상태 확인 (잠금 해제 시간이 지난 기록은 TTL로 곧 만료됨)
+    remaining = int((locked_until - datetime.utcnow()).total_seconds())
+    if remaining <= 0:
+        return True, 0
+    return False, remaining
 
 
 def record_login_attempt(email: str, success: bool):
     """로그인 시도 기록"""
-    if success:
-        # 성공 시 기록 삭제
-        if email in login_attempts:
-            del login_attempts[email]
-        return
-    
-    # 실패 시 기록
-    if email not in login_attempts:
-        login_attempts[email] = [1, None]
-    else:
-        attempts, _ = login_attempts[email]
+    with _login_attempts_lock:
+        if success:
+            # 성공 시 기록 삭제
+            login_attempts.pop(email, None)
+            return
+        
+        # 실패 시 기록 (잠금이 풀린 기록은 처음부터 다시 셈)
+        attempts, locked_until = login_attempts.get(email, (0, None))
+        if locked_until and datetime.utcnow() > locked_until:
+            attempts = 0
         attempts += 1
         
         # 최대 시도 횟수 초과 시 잠금
         if attempts >= MAX_LOGIN_ATTEMPTS:
             locked_until = datetime.utcnow() + timedelta(minutes=LOCKOUT_DURATION_MINUTES)
-            login_attempts[email] = [attempts, locked_until]
+            login_attempts[email] = (attempts, locked_until)
         else:
-            login_attempts[email] = [attempts, None]
+            login_attempts[email] = (attempts, None)
 
 
 def get_remaining_attempts(email: str) -> int:
     """남은 로그인 시도 횟수 반환"""
-    if email not in login_attempts:
+    with _login_attempts_lock:
+        record = login_attempts.get(email)
+    if record is None:
         return MAX_LOGIN_ATTEMPTS
     
-    attempts, _ = login_attempts[email]
-    return max(0, MAX_LOGIN_ATTEMPTS - attempts)
+    return max(0, MAX_LOGIN_ATTEMPTS - record[0])
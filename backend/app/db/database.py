@@ -10,18 +10,28 @@ from sqlalchemy.orm import sessionmaker
 load_dotenv()   
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-# MySQL 연결 시 UTF-8 문자셋 강제 (한글 깨짐 방지)
+# 커넥션 풀 설정 (FastAPI 동시 요청 수 기준으로 조정)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 초 (MySQL wait_timeout 이전에 재연결)
+
+# MySQL 연결 시 UTF-8 문자셋 강제 (한글 깨짐 방지) - URL 문자열 대신 드라이버 인자로 전달
+connect_args = {}
 if DATABASE_URL and "mysql" in DATABASE_URL:
-    # charset 파라미터가 없으면 추가
-    if "charset=" not in DATABASE_URL:
-        if "?" in DATABASE_URL:
-            DATABASE_URL = DATABASE_URL + "&charset=utf8mb4"
-        else:
-            DATABASE_URL = DATABASE_URL + "?charset=utf8mb4"
+    connect_args["charset"] = "utf8mb4"
 
 
 # DB 연결 엔진 생성
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# pool_use_lifo: 최근 사용한 커넥션을 먼저 재사용해서 유휴 커넥션은 자연스럽게 정리되도록
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+    connect_args=connect_args,
+)
 
 # DB 세션 클래스 생성
 db_session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
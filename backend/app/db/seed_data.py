@@ -4,8 +4,12 @@
 - 강릉원주대 x 강원대학교 AI 개발자 해커톤 (1월)
 """
 
-from datetime import datetime, timedelta, date
-import uuid
+from datetime import datetime, timedelta, date, time
+from typing import List
+import os
+from functools import cache
+from itertools import chain
+from sqlalchemy import delete
 from app.core.security import get_password_hash
 
 # 테스트 사용자 ID (고정)
@@ -14,13 +18,41 @@ TEST_USER_EMAIL = "demo@five-today.com"
 TEST_USER_PASSWORD = "demo1234"
 
 
-def get_seed_user():
+def _uuid_batch(n: int) -> List[str]:
+    """UUID4 문자열 n개 생성 (os.urandom 한 번 호출 후 잘라서 사용)"""
+    raw = bytearray(os.urandom(16 * n))
+    ids = []
+    for i in range(0, 16 * n, 16):
+        raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40  # version 4
+        raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw[i:i + 16].hex()
+        ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return ids
+
+
+def _with_ids(templates, id_key: str) -> List[dict]:
+    """템플릿을 얕은 복사(dict.copy)한 뒤 새 UUID를 id_key에 부여"""
+    rows = []
+    for template, row_id in zip(templates, _uuid_batch(len(templates))):
+        row = template.copy()
+        row[id_key] = row_id
+        rows.append(row)
+    return rows
+
+
+@cache
+def _demo_password_hash() -> str:
+    """테스트 계정 비밀번호 해시 (bcrypt는 느리므로 프로세스당 1회만 계산)"""
+    return get_password_hash(TEST_USER_PASSWORD)
+
+
+def get_seed_user(now: datetime = None):
     """테스트 사용자 데이터"""
-    now = datetime.now()
+    now = now or datetime.now()
     return {
         "user_id": TEST_USER_ID,
         "email": TEST_USER_EMAIL,
-        "password": get_password_hash(TEST_USER_PASSWORD),
+        "password": _demo_password_hash(),
         "create_at": now,
         "update_at": now,
         "name": "김강원",
@@ -30,135 +62,135 @@ def get_seed_user():
     }
 
 
+# 일정 원본 테이블 (모듈 로드 시 1회 생성되는 tuple)
+# (title, category, start(월, 일, 시, 분), end(월, 일, 시, 분), priority, type, text, color)
+# ========================================
+# 1월 해커톤 일정 (강릉원주대 x 강원대학교 AI 개발자 해커톤)
+# ========================================
+_HACKATHON_SCHEDULES = (
+    # Day 1 (1/5 월) - 교육 준비
+    ("IBM AI 해커톤 오프닝", "activity", (1, 5, 9, 30), (1, 5, 10, 30), 5, None, "강릉원주대 x 강원대학교 AI 개발자 해커톤", "#4F8CFF"),
+    ("Design Thinking Workshop", "activity", (1, 5, 10, 30), (1, 5, 11, 30), 4, None, None, "#4F8CFF"),
+    ("Innovation Studio Tour & AI 특강", "activity", (1, 5, 13, 0), (1, 5, 13, 50), 4, None, None, "#4F8CFF"),
+    ("생성형 AI 개념 이해", "activity", (1, 5, 13, 50), (1, 5, 14, 40), 4, None, None, "#4F8CFF"),
+    ("IBM watsonx platform 이해", "activity", (1, 5, 15, 0), (1, 5, 15, 50), 4, None, None, "#4F8CFF"),
+    ("실습개발환경 준비", "activity", (1, 5, 16, 0), (1, 5, 17, 30), 4, None, None, "#4F8CFF"),
+
+    # Day 2 (1/6 화) - 생성형 AI 실습
+    ("Prompt Engineering 개념 이해", "activity", (1, 6, 9, 30), (1, 6, 10, 30), 4, None, "생성형 AI 실습", "#9B7EFF"),
+    ("Prompt Engineering 실습", "activity", (1, 6, 10, 30), (1, 6, 11, 30), 4, None, None, "#9B7EFF"),
+    ("생성형 AI를 활용한 서비스 구현 방안 이해 및 실습", "activity", (1, 6, 13, 0), (1, 6, 13, 50), 4, None, None, "#9B7EFF"),
+    ("RAG Pattern 개념 이해 및 실습", "activity", (1, 6, 13, 50), (1, 6, 14, 40), 4, None, None, "#9B7EFF"),
+    ("Vector DB 이해 및 실습", "activity", (1, 6, 15, 0), (1, 6, 15, 50), 4, None, None, "#9B7EFF"),
+    ("서비스 개발 및 배포 환경 이해", "activity", (1, 6, 16, 0), (1, 6, 17, 0), 4, None, None, "#9B7EFF"),
+    ("조별과제 논의", "team", (1, 6, 17, 0), (1, 6, 17, 30), 3, None, None, "#7ED957"),
+
+    # Day 3 (1/7 수) - Agentic AI 실습
+    ("생성형 AI 유즈 케이스 기반 실습 1", "activity", (1, 7, 9, 30), (1, 7, 10, 30), 4, None, "Agentic AI 실습", "#4ECDC4"),
+    ("생성형 AI 유즈 케이스 기반 실습 2", "activity", (1, 7, 10, 30), (1, 7, 11, 30), 4, None, None, "#4ECDC4"),
+    ("AI Agent 개념 및 플랫폼 소개", "activity", (1, 7, 13, 0), (1, 7, 13, 50), 4, None, None, "#4ECDC4"),
+    ("AI Agent 유즈 케이스 기반 실습 1", "activity", (1, 7, 13, 50), (1, 7, 14, 40), 4, None, None, "#4ECDC4"),
+    ("AI Agent 유즈 케이스 기반 실습 2", "activity", (1, 7, 15, 0), (1, 7, 15, 50), 4, None, None, "#4ECDC4"),
+    ("AI Agent Orchestration 활용 사례 데모", "activity", (1, 7, 16, 0), (1, 7, 17, 0), 4, None, None, "#4ECDC4"),
+    ("조별과제 논의", "team", (1, 7, 17, 0), (1, 7, 17, 30), 3, None, None, "#7ED957"),
+
+    # Day 4 (1/8 목) - Project 준비
+    ("IBM Client Zero 및 watsonx Challenge 사례 소개", "activity", (1, 8, 9, 30), (1, 8, 10, 30), 4, None, "Project 준비", "#FFB347"),
+    ("watsonx Code Assistant 소개 및 활용 데모", "activity", (1, 8, 10, 30), (1, 8, 11, 30), 4, None, None, "#FFB347"),
+    ("멘토링 및 프로젝트 절차 소개", "activity", (1, 8, 13, 0), (1, 8, 13, 50), 4, None, None, "#FFB347"),
+    ("Design Thinking Workshop", "activity", (1, 8, 13, 50), (1, 8, 14, 40), 4, None, None, "#FFB347"),
+    ("조별 주제 선정", "team", (1, 8, 15, 0), (1, 8, 17, 0), 5, None, None, "#7ED957"),
+    ("조별 과제 준비", "team", (1, 8, 17, 0), (1, 8, 17, 30), 4, None, None, "#7ED957"),
+
+    # Day 5-9 (1/9~14) - Project & Mentoring
+    ("해커톤 프로젝트 수행", "team", (1, 9, 9, 0), (1, 14, 18, 0), 5, "task", "Project & Mentoring 기간", "#FF6B6B"),
+    ("멘토링 세션", "activity", (1, 9, 17, 0), (1, 9, 17, 30), 4, None, None, "#FF8ED4"),
+
+    # Day 10 (1/15 목) - Project 발표
+    ("현직자와 질의 응답 1", "activity", (1, 15, 9, 30), (1, 15, 10, 30), 4, None, "Project 발표", "#FF8ED4"),
+    ("현직자와 질의 응답 2", "activity", (1, 15, 10, 30), (1, 15, 11, 30), 4, None, None, "#FF8ED4"),
+    ("해커톤 결과 발표", "activity", (1, 15, 13, 50), (1, 15, 14, 40), 5, None, None, "#FF6B6B"),
+
+    # Day 11 (1/16 금) - 최종 발표 및 시상
+    ("해커톤 최종 발표", "activity", (1, 16, 15, 0), (1, 16, 17, 0), 5, None, "최종 발표", "#FF6B6B"),
+    ("🏆 시상 및 종료", "activity", (1, 16, 17, 0), (1, 16, 17, 30), 5, None, "강릉원주대 x 강원대학교 AI 개발자 해커톤 종료", "#FFE066"),
+)
+
+# ========================================
+# 강원대학교 2026년 학사일정 (2월~8월)
+# ========================================
+_KANGWON_SCHEDULES = (
+    # 2월
+    ("제1차 정시모집 합격자 발표", "other", (2, 6, 10, 0), (2, 6, 18, 0), 3, None, None, "#A0A0A0"),
+    ("제1차 정시모집 등록", "other", (2, 10, 9, 0), (2, 12, 16, 0), 3, None, None, "#A0A0A0"),
+    ("제2차 정시모집 합격자 발표", "other", (2, 16, 10, 0), (2, 16, 18, 0), 3, None, None, "#A0A0A0"),
+    ("제2차 정시모집 등록", "other", (2, 19, 9, 0), (2, 20, 16, 0), 3, None, None, "#A0A0A0"),
+    ("추가모집 합격자 발표", "other", (2, 25, 10, 0), (2, 25, 18, 0), 3, None, None, "#A0A0A0"),
+    ("추가모집 등록", "other", (2, 26, 9, 0), (2, 27, 16, 0), 3, None, None, "#A0A0A0"),
+    ("학위수여식", "activity", (2, 20, 11, 0), (2, 20, 12, 0), 4, None, None, "#FFE066"),
+
+    # 3월
+    ("1학기 개강", "class", (3, 2, 9, 0), (3, 2, 18, 0), 5, None, "2026학년도 1학기 시작", "#4F8CFF"),
+    ("수강신청 정정기간", "class", (3, 2, 9, 0), (3, 6, 17, 0), 4, "task", None, "#9B7EFF"),
+    ("1학기 등록금 납부기간", "other", (3, 2, 9, 0), (3, 13, 16, 0), 4, None, None, "#FFB347"),
+    ("삼일절 (휴일)", "other", (3, 1, 0, 0), (3, 1, 23, 59), 2, None, None, "#FF6B6B"),
+    ("수강철회 기간", "class", (3, 23, 9, 0), (3, 27, 17, 0), 3, "task", None, "#9B7EFF"),
+
+    # 4월
+    ("중간고사 기간", "exam", (4, 20, 9, 0), (4, 24, 18, 0), 5, "task", "1학기 중간고사", "#FF6B6B"),
+
+    # 5월
+    ("어린이날 (휴일)", "other", (5, 5, 0, 0), (5, 5, 23, 59), 2, None, None, "#7ED957"),
+    ("석가탄신일 (휴일)", "other", (5, 24, 0, 0), (5, 24, 23, 59), 2, None, None, "#7ED957"),
+    ("대동제 (축제)", "activity", (5, 13, 18, 0), (5, 15, 22, 0), 4, None, "강원대학교 대동제", "#FF8ED4"),
+
+    # 6월
+    ("현충일 (휴일)", "other", (6, 6, 0, 0), (6, 6, 23, 59), 2, None, None, "#A0A0A0"),
+    ("기말고사 기간", "exam", (6, 15, 9, 0), (6, 19, 18, 0), 5, "task", "1학기 기말고사", "#FF6B6B"),
+    ("1학기 종강", "class", (6, 19, 9, 0), (6, 19, 18, 0), 4, None, None, "#4F8CFF"),
+    ("1학기 성적입력 기간", "class", (6, 22, 9, 0), (6, 26, 17, 0), 3, None, None, "#9B7EFF"),
+    ("1학기 성적열람 및 이의신청", "class", (6, 29, 9, 0), (7, 1, 17, 0), 3, "task", None, "#9B7EFF"),
+
+    # 7월
+    ("여름방학 시작", "other", (7, 1, 0, 0), (7, 1, 23, 59), 3, None, "여름방학", "#4ECDC4"),
+    ("계절학기 수강신청", "class", (7, 6, 9, 0), (7, 8, 17, 0), 3, None, None, "#9B7EFF"),
+    ("하계 계절학기", "class", (7, 13, 9, 0), (8, 7, 18, 0), 3, "task", None, "#4ECDC4"),
+
+    # 8월
+    ("2학기 수강신청", "class", (8, 17, 9, 0), (8, 21, 17, 0), 4, "task", "2학기 수강신청 기간", "#9B7EFF"),
+    ("광복절 (휴일)", "other", (8, 15, 0, 0), (8, 15, 23, 59), 2, None, None, "#FF6B6B"),
+    ("2학기 개강", "class", (8, 31, 9, 0), (8, 31, 18, 0), 5, None, "2026학년도 2학기 시작", "#4F8CFF"),
+)
+
+
+# 일정 템플릿 (ID 제외) - datetime 객체까지 모듈 로드 시 1회만 생성
+_SCHEDULE_BASE_YEAR = 2026
+_SCHEDULE_TEMPLATES = tuple(
+    {
+        "user_id": TEST_USER_ID,
+        "type": schedule_type or "event",
+        "title": title,
+        "category": category,
+        "start_at": datetime(_SCHEDULE_BASE_YEAR, *start),
+        "end_at": datetime(_SCHEDULE_BASE_YEAR, *end),
+        "priority_score": priority,
+        "original_text": text,
+        "source": "manual",
+        "color": color,
+    }
+    for title, category, start, end, priority, schedule_type, text, color
+    in chain(_HACKATHON_SCHEDULES, _KANGWON_SCHEDULES)
+)
+
+
 def get_seed_schedules():
-    """일정 데이터 - 해커톤 + 강원대 학사일정"""
-    schedules = []
-    
-    # ========================================
-    # 1월 해커톤 일정 (강릉원주대 x 강원대학교 AI 개발자 해커톤)
-    # ========================================
-    hackathon_schedules = [
-        # Day 1 (1/5 월) - 교육 준비
-        {"title": "IBM AI 해커톤 오프닝", "category": "activity", "start": (1, 5, 9, 30), "end": (1, 5, 10, 30), "priority": 5, "text": "강릉원주대 x 강원대학교 AI 개발자 해커톤", "color": "#4F8CFF"},
-        {"title": "Design Thinking Workshop", "category": "activity", "start": (1, 5, 10, 30), "end": (1, 5, 11, 30), "priority": 4, "color": "#4F8CFF"},
-        {"title": "Innovation Studio Tour & AI 특강", "category": "activity", "start": (1, 5, 13, 0), "end": (1, 5, 13, 50), "priority": 4, "color": "#4F8CFF"},
-        {"title": "생성형 AI 개념 이해", "category": "activity", "start": (1, 5, 13, 50), "end": (1, 5, 14, 40), "priority": 4, "color": "#4F8CFF"},
-        {"title": "IBM watsonx platform 이해", "category": "activity", "start": (1, 5, 15, 0), "end": (1, 5, 15, 50), "priority": 4, "color": "#4F8CFF"},
-        {"title": "실습개발환경 준비", "category": "activity", "start": (1, 5, 16, 0), "end": (1, 5, 17, 30), "priority": 4, "color": "#4F8CFF"},
-        
-        # Day 2 (1/6 화) - 생성형 AI 실습
-        {"title": "Prompt Engineering 개념 이해", "category": "activity", "start": (1, 6, 9, 30), "end": (1, 6, 10, 30), "priority": 4, "text": "생성형 AI 실습", "color": "#9B7EFF"},
-        {"title": "Prompt Engineering 실습", "category": "activity", "start": (1, 6, 10, 30), "end": (1, 6, 11, 30), "priority": 4, "color": "#9B7EFF"},
-        {"title": "생성형 AI를 활용한 서비스 구현 방안 이해 및 실습", "category": "activity", "start": (1, 6, 13, 0), "end": (1, 6, 13, 50), "priority": 4, "color": "#9B7EFF"},
-        {"title": "RAG Pattern 개념 이해 및 실습", "category": "activity", "start": (1, 6, 13, 50), "end": (1, 6, 14, 40), "priority": 4, "color": "#9B7EFF"},
-        {"title": "Vector DB 이해 및 실습", "category": "activity", "start": (1, 6, 15, 0), "end": (1, 6, 15, 50), "priority": 4, "color": "#9B7EFF"},
-        {"title": "서비스 개발 및 배포 환경 이해", "category": "activity", "start": (1, 6, 16, 0), "end": (1, 6, 17, 0), "priority": 4, "color": "#9B7EFF"},
-        {"title": "조별과제 논의", "category": "team", "start": (1, 6, 17, 0), "end": (1, 6, 17, 30), "priority": 3, "color": "#7ED957"},
-        
-        # Day 3 (1/7 수) - Agentic AI 실습
-        {"title": "생성형 AI 유즈 케이스 기반 실습 1", "category": "activity", "start": (1, 7, 9, 30), "end": (1, 7, 10, 30), "priority": 4, "text": "Agentic AI 실습", "color": "#4ECDC4"},
-        {"title": "생성형 AI 유즈 케이스 기반 실습 2", "category": "activity", "start": (1, 7, 10, 30), "end": (1, 7, 11, 30), "priority": 4, "color": "#4ECDC4"},
-        {"title": "AI Agent 개념 및 플랫폼 소개", "category": "activity", "start": (1, 7, 13, 0), "end": (1, 7, 13, 50), "priority": 4, "color": "#4ECDC4"},
-        {"title": "AI Agent 유즈 케이스 기반 실습 1", "category": "activity", "start": (1, 7, 13, 50), "end": (1, 7, 14, 40), "priority": 4, "color": "#4ECDC4"},
-        {"title": "AI Agent 유즈 케이스 기반 실습 2", "category": "activity", "start": (1, 7, 15, 0), "end": (1, 7, 15, 50), "priority": 4, "color": "#4ECDC4"},
-        {"title": "AI Agent Orchestration 활용 사례 데모", "category": "activity", "start": (1, 7, 16, 0), "end": (1, 7, 17, 0), "priority": 4, "color": "#4ECDC4"},
-        {"title": "조별과제 논의", "category": "team", "start": (1, 7, 17, 0), "end": (1, 7, 17, 30), "priority": 3, "color": "#7ED957"},
-        
-        # Day 4 (1/8 목) - Project 준비
-        {"title": "IBM Client Zero 및 watsonx Challenge 사례 소개", "category": "activity", "start": (1, 8, 9, 30), "end": (1, 8, 10, 30), "priority": 4, "text": "Project 준비", "color": "#FFB347"},
-        {"title": "watsonx Code Assistant 소개 및 활용 데모", "category": "activity", "start": (1, 8, 10, 30), "end": (1, 8, 11, 30), "priority": 4, "color": "#FFB347"},
-        {"title": "멘토링 및 프로젝트 절차 소개", "category": "activity", "start": (1, 8, 13, 0), "end": (1, 8, 13, 50), "priority": 4, "color": "#FFB347"},
-        {"title": "Design Thinking Workshop", "category": "activity", "start": (1, 8, 13, 50), "end": (1, 8, 14, 40), "priority": 4, "color": "#FFB347"},
-        {"title": "조별 주제 선정", "category": "team", "start": (1, 8, 15, 0), "end": (1, 8, 17, 0), "priority": 5, "color": "#7ED957"},
-        {"title": "조별 과제 준비", "category": "team", "start": (1, 8, 17, 0), "end": (1, 8, 17, 30), "priority": 4, "color": "#7ED957"},
-        
-        # Day 5-9 (1/9~14) - Project & Mentoring
-        {"title": "해커톤 프로젝트 수행", "category": "team", "start": (1, 9, 9, 0), "end": (1, 14, 18, 0), "priority": 5, "type": "task", "text": "Project & Mentoring 기간", "color": "#FF6B6B"},
-        {"title": "멘토링 세션", "category": "activity", "start": (1, 9, 17, 0), "end": (1, 9, 17, 30), "priority": 4, "color": "#FF8ED4"},
-        
-        # Day 10 (1/15 목) - Project 발표
-        {"title": "현직자와 질의 응답 1", "category": "activity", "start": (1, 15, 9, 30), "end": (1, 15, 10, 30), "priority": 4, "text": "Project 발표", "color": "#FF8ED4"},
-        {"title": "현직자와 질의 응답 2", "category": "activity", "start": (1, 15, 10, 30), "end": (1, 15, 11, 30), "priority": 4, "color": "#FF8ED4"},
-        {"title": "해커톤 결과 발표", "category": "activity", "start": (1, 15, 13, 50), "end": (1, 15, 14, 40), "priority": 5, "color": "#FF6B6B"},
-        
-        # Day 11 (1/16 금) - 최종 발표 및 시상
-        {"title": "해커톤 최종 발표", "category": "activity", "start": (1, 16, 15, 0), "end": (1, 16, 17, 0), "priority": 5, "text": "최종 발표", "color": "#FF6B6B"},
-        {"title": "🏆 시상 및 종료", "category": "activity", "start": (1, 16, 17, 0), "end": (1, 16, 17, 30), "priority": 5, "text": "강릉원주대 x 강원대학교 AI 개발자 해커톤 종료", "color": "#FFE066"},
-    ]
-    
-    # ========================================
-    # 강원대학교 2026년 학사일정 (2월~8월)
-    # ========================================
-    kangwon_schedules = [
-        # 2월
-        {"title": "제1차 정시모집 합격자 발표", "category": "other", "start": (2, 6, 10, 0), "end": (2, 6, 18, 0), "priority": 3, "color": "#A0A0A0"},
-        {"title": "제1차 정시모집 등록", "category": "other", "start": (2, 10, 9, 0), "end": (2, 12, 16, 0), "priority": 3, "color": "#A0A0A0"},
-        {"title": "제2차 정시모집 합격자 발표", "category": "other", "start": (2, 16, 10, 0), "end": (2, 16, 18, 0), "priority": 3, "color": "#A0A0A0"},
-        {"title": "제2차 정시모집 등록", "category": "other", "start": (2, 19, 9, 0), "end": (2, 20, 16, 0), "priority": 3, "color": "#A0A0A0"},
-        {"title": "추가모집 합격자 발표", "category": "other", "start": (2, 25, 10, 0), "end": (2, 25, 18, 0), "priority": 3, "color": "#A0A0A0"},
-        {"title": "추가모집 등록", "category": "other", "start": (2, 26, 9, 0), "end": (2, 27, 16, 0), "priority": 3, "color": "#A0A0A0"},
-        {"title": "학위수여식", "category": "activity", "start": (2, 20, 11, 0), "end": (2, 20, 12, 0), "priority": 4, "color": "#FFE066"},
-        
-        # 3월
-        {"title": "1학기 개강", "category": "class", "start": (3, 2, 9, 0), "end": (3, 2, 18, 0), "priority": 5, "text": "2026학년도 1학기 시작", "color": "#4F8CFF"},
-        {"title": "수강신청 정정기간", "category": "class", "start": (3, 2, 9, 0), "end": (3, 6, 17, 0), "priority": 4, "type": "task", "color": "#9B7EFF"},
-        {"title": "1학기 등록금 납부기간", "category": "other", "start": (3, 2, 9, 0), "end": (3, 13, 16, 0), "priority": 4, "color": "#FFB347"},
-        {"title": "삼일절 (휴일)", "category": "other", "start": (3, 1, 0, 0), "end": (3, 1, 23, 59), "priority": 2, "color": "#FF6B6B"},
-        {"title": "수강철회 기간", "category": "class", "start": (3, 23, 9, 0), "end": (3, 27, 17, 0), "priority": 3, "type": "task", "color": "#9B7EFF"},
-        
-        # 4월
-        {"title": "중간고사 기간", "category": "exam", "start": (4, 20, 9, 0), "end": (4, 24, 18, 0), "priority": 5, "type": "task", "text": "1학기 중간고사", "color": "#FF6B6B"},
-        
-        # 5월
-        {"title": "어린이날 (휴일)", "category": "other", "start": (5, 5, 0, 0), "end": (5, 5, 23, 59), "priority": 2, "color": "#7ED957"},
-        {"title": "석가탄신일 (휴일)", "category": "other", "start": (5, 24, 0, 0), "end": (5, 24, 23, 59), "priority": 2, "color": "#7ED957"},
-        {"title": "대동제 (축제)", "category": "activity", "start": (5, 13, 18, 0), "end": (5, 15, 22, 0), "priority": 4, "text": "강원대학교 대동제", "color": "#FF8ED4"},
-        
-        # 6월
-        {"title": "현충일 (휴일)", "category": "other", "start": (6, 6, 0, 0), "end": (6, 6, 23, 59), "priority": 2, "color": "#A0A0A0"},
-        {"title": "기말고사 기간", "category": "exam", "start": (6, 15, 9, 0), "end": (6, 19, 18, 0), "priority": 5, "type": "task", "text": "1학기 기말고사", "color": "#FF6B6B"},
-        {"title": "1학기 종강", "category": "class", "start": (6, 19, 9, 0), "end": (6, 19, 18, 0), "priority": 4, "color": "#4F8CFF"},
-        {"title": "1학기 성적입력 기간", "category": "class", "start": (6, 22, 9, 0), "end": (6, 26, 17, 0), "priority": 3, "color": "#9B7EFF"},
-        {"title": "1학기 성적열람 및 이의신청", "category": "class", "start": (6, 29, 9, 0), "end": (7, 1, 17, 0), "priority": 3, "type": "task", "color": "#9B7EFF"},
-        
-        # 7월
-        {"title": "여름방학 시작", "category": "other", "start": (7, 1, 0, 0), "end": (7, 1, 23, 59), "priority": 3, "text": "여름방학", "color": "#4ECDC4"},
-        {"title": "계절학기 수강신청", "category": "class", "start": (7, 6, 9, 0), "end": (7, 8, 17, 0), "priority": 3, "color": "#9B7EFF"},
-        {"title": "하계 계절학기", "category": "class", "start": (7, 13, 9, 0), "end": (8, 7, 18, 0), "priority": 3, "type": "task", "color": "#4ECDC4"},
-        
-        # 8월
-        {"title": "2학기 수강신청", "category": "class", "start": (8, 17, 9, 0), "end": (8, 21, 17, 0), "priority": 4, "type": "task", "text": "2학기 수강신청 기간", "color": "#9B7EFF"},
-        {"title": "광복절 (휴일)", "category": "other", "start": (8, 15, 0, 0), "end": (8, 15, 23, 59), "priority": 2, "color": "#FF6B6B"},
-        {"title": "2학기 개강", "category": "class", "start": (8, 31, 9, 0), "end": (8, 31, 18, 0), "priority": 5, "text": "2026학년도 2학기 시작", "color": "#4F8CFF"},
-    ]
-    
-    # 일정 데이터 변환
-    base_year = 2026
-    
-    for item in hackathon_schedules + kangwon_schedules:
-        start = item["start"]
-        end = item["end"]
-        
-        schedule = {
-            "schedule_id": str(uuid.uuid4()),
-            "user_id": TEST_USER_ID,
-            "type": item.get("type", "event"),
-            "title": item["title"],
-            "category": item["category"],
-            "start_at": datetime(base_year, start[0], start[1], start[2], start[3]),
-            "end_at": datetime(base_year, end[0], end[1], end[2], end[3]),
-            "priority_score": item["priority"],
-            "original_text": item.get("text"),
-            "source": "manual",
-            "color": item.get("color"),
-        }
-        schedules.append(schedule)
-    
-    return schedules
+    """일정 데이터 - 해커톤 + 강원대 학사일정 (미리 만든 템플릿에 새 ID만 부여)"""
+    return _with_ids(_SCHEDULE_TEMPLATES, "schedule_id")
 
 
-def get_seed_sub_tasks():
-    """할 일(SubTask) 데이터"""
+@cache
+def _sub_task_templates():
+    """할 일 템플릿 (ID 제외, 프로세스당 1회 생성)"""
     base_year = 2026
     
     sub_tasks = [
@@ -231,42 +263,48 @@ def get_seed_sub_tasks():
         {"title": "2학기 목표 설정", "date": date(base_year, 8, 28), "estimated_minute": 30, "is_done": False, "priority": "medium", "category": "other", "tip": "지난 학기 회고하기! 🎯"},
     ]
     
-    # user_id와 sub_task_id 자동 추가
+    # user_id 추가 (독립적인 할 일이므로 schedule_id 없음)
     for task in sub_tasks:
-        task["sub_task_id"] = str(uuid.uuid4())
         task["user_id"] = TEST_USER_ID
-        task["schedule_id"] = None  # 독립적인 할 일
+        task["schedule_id"] = None
     
-    return sub_tasks
+    return tuple(sub_tasks)
+
+
+def get_seed_sub_tasks():
+    """할 일(SubTask) 데이터 (캐시된 템플릿에 새 ID만 부여)"""
+    return _with_ids(_sub_task_templates(), "sub_task_id")
 
 
-def get_seed_notifications(schedules):
+# 알림 시각 오프셋 (일 단위, timedelta는 모듈 로드 시 1회 생성)
+_DAY_OFFSETS = {days: timedelta(days=days) for days in (2, 15)}
+
+
+def get_seed_notifications(schedules, now: datetime = None):
     """알림 시드 데이터
     
     Args:
         schedules: 일정 목록 (schedule_id를 참조하기 위해)
+        now: 기준 시각 (없으면 현재 시각)
     """
-    now = datetime.now()
+    now = now or datetime.now()
     
-    # 해커톤 최종 발표 일정 찾기
-    hackathon_final = None
-    semester_start = None
-    for s in schedules:
-        if "최종 발표" in s.get("title", ""):
-            hackathon_final = s
-        if "1학기 개강" in s.get("title", ""):
-            semester_start = s
+    # 알림을 연결할 일정 찾기 (제목으로 한 번 인덱싱)
+    by_title = {s["title"]: s for s in schedules}
+    hackathon_final = by_title.get("해커톤 최종 발표")
+    semester_start = by_title.get("1학기 개강")
     
     notifications = []
+    notification_ids = iter(_uuid_batch(2))
     
     # 해커톤 관련 알림 (일정이 있으면 연결)
     if hackathon_final:
         notifications.append({
-            "notification_id": str(uuid.uuid4()),
+            "notification_id": next(notification_ids),
             "user_id": TEST_USER_ID,
             "schedule_id": hackathon_final["schedule_id"],
             "message": "🏆 강릉원주대 x 강원대학교 AI 개발자 해커톤에서 수상했습니다! 축하합니다!",
-            "notify_at": now - timedelta(days=15),
+            "notify_at": now - _DAY_OFFSETS[15],
             "is_sent": True,
             "is_checked": False,
         })
@@ -274,11 +312,11 @@ def get_seed_notifications(schedules):
     # 개강 관련 알림
     if semester_start:
         notifications.append({
-            "notification_id": str(uuid.uuid4()),
+            "notification_id": next(notification_ids),
             "user_id": TEST_USER_ID,
             "schedule_id": semester_start["schedule_id"],
             "message": "📚 1학기 개강이 한 달 앞으로 다가왔습니다. 수강신청 준비하세요!",
-            "notify_at": now - timedelta(days=2),
+            "notify_at": now - _DAY_OFFSETS[2],
             "is_sent": True,
             "is_checked": False,
         })
@@ -286,60 +324,59 @@ def get_seed_notifications(schedules):
     return notifications
 
 
-def get_seed_lectures():
-    """강의 시간표 데이터 (1학기)"""
-    from datetime import time
-    
+# 강의 시간표 원본 테이블 (title, day, start_time, end_time) - 시간은 time 객체로 미리 생성
+_LECTURES = (
+    # 월요일
+    ("운영체제 (김철수, 공대 301호)", "mon", time(9, 0), time(10, 30)),
+    ("알고리즘 (이영희, 공대 201호)", "mon", time(13, 0), time(14, 30)),
+
+    # 화요일
+    ("데이터베이스 (박민수, 공대 401호)", "tue", time(10, 30), time(12, 0)),
+    ("인공지능 (정수연, 공대 501호)", "tue", time(15, 0), time(16, 30)),
+
+    # 수요일
+    ("운영체제 (김철수, 공대 301호)", "wed", time(9, 0), time(10, 30)),
+    ("컴퓨터네트워크 (최지훈, 공대 302호)", "wed", time(13, 0), time(14, 30)),
+
+    # 목요일
+    ("데이터베이스 (박민수, 공대 401호)", "thu", time(10, 30), time(12, 0)),
+    ("인공지능 (정수연, 공대 501호)", "thu", time(15, 0), time(16, 30)),
+
+    # 금요일
+    ("알고리즘 (이영희, 공대 201호)", "fri", time(9, 0), time(10, 30)),
+    ("컴퓨터네트워크 (최지훈, 공대 302호)", "fri", time(13, 0), time(14, 30)),
+)
+
+# day 매핑: mon=0, tue=1, wed=2, thu=3, fri=4
+_DAY_MAP = {"mon": "0", "tue": "1", "wed": "2", "thu": "3", "fri": "4", "sat": "5", "sun": "6"}
+
+
+@cache
+def _lecture_templates():
+    """강의 템플릿 (ID 제외, 프로세스당 1회 생성)"""
     base_year = 2026
     # 1학기 시작: 3월 2일, 종료: 6월 19일 (약 16주)
     semester_start = date(base_year, 3, 2)
     semester_end = date(base_year, 6, 19)
     
-    # day 매핑: mon=0, tue=1, wed=2, thu=3, fri=4
-    day_map = {"mon": "0", "tue": "1", "wed": "2", "thu": "3", "fri": "4", "sat": "5", "sun": "6"}
-    
-    lectures = [
-        # 월요일
-        {"title": "운영체제 (김철수, 공대 301호)", "day": "mon", "start_time": "09:00", "end_time": "10:30"},
-        {"title": "알고리즘 (이영희, 공대 201호)", "day": "mon", "start_time": "13:00", "end_time": "14:30"},
-        
-        # 화요일
-        {"title": "데이터베이스 (박민수, 공대 401호)", "day": "tue", "start_time": "10:30", "end_time": "12:00"},
-        {"title": "인공지능 (정수연, 공대 501호)", "day": "tue", "start_time": "15:00", "end_time": "16:30"},
-        
-        # 수요일
-        {"title": "운영체제 (김철수, 공대 301호)", "day": "wed", "start_time": "09:00", "end_time": "10:30"},
-        {"title": "컴퓨터네트워크 (최지훈, 공대 302호)", "day": "wed", "start_time": "13:00", "end_time": "14:30"},
-        
-        # 목요일
-        {"title": "데이터베이스 (박민수, 공대 401호)", "day": "thu", "start_time": "10:30", "end_time": "12:00"},
-        {"title": "인공지능 (정수연, 공대 501호)", "day": "thu", "start_time": "15:00", "end_time": "16:30"},
-        
-        # 금요일
-        {"title": "알고리즘 (이영희, 공대 201호)", "day": "fri", "start_time": "09:00", "end_time": "10:30"},
-        {"title": "컴퓨터네트워크 (최지훈, 공대 302호)", "day": "fri", "start_time": "13:00", "end_time": "14:30"},
-    ]
-    
-    now = datetime.now()
-    result = []
-    for lecture in lectures:
-        # 시간 문자열을 time 객체로 변환
-        start_h, start_m = map(int, lecture["start_time"].split(":"))
-        end_h, end_m = map(int, lecture["end_time"].split(":"))
-        
-        result.append({
-            "lecture_id": str(uuid.uuid4()),
+    return tuple(
+        {
             "user_id": TEST_USER_ID,
-            "title": lecture["title"],
-            "start_time": time(start_h, start_m),
-            "end_time": time(end_h, end_m),
+            "title": title,
+            "start_time": start_time,
+            "end_time": end_time,
             "start_day": semester_start,
             "end_day": semester_end,
-            "week": day_map[lecture["day"]],  # 요일을 숫자로 변환
+            "week": _DAY_MAP[day],  # 요일을 숫자로 변환
             "update_text": None,
-        })
-    
-    return result
+        }
+        for title, day, start_time, end_time in _LECTURES
+    )
+
+
+def get_seed_lectures():
+    """강의 시간표 데이터 (1학기, 캐시된 템플릿에 새 ID만 부여)"""
+    return _with_ids(_lecture_templates(), "lecture_id")
 
 
 def seed_database(db, force_reseed=False):
@@ -355,8 +392,8 @@ def seed_database(db, force_reseed=False):
     from app.models.notification import Notification
     from app.models.lecture import Lecture
     
-    # 테스트 사용자가 이미 있는지 확인
-    existing_user = db.query(User).filter(User.user_id == TEST_USER_ID).first()
+    # 테스트 사용자가 이미 있는지 확인 (엔티티를 세션에 올리지 않도록 PK만 조회)
+    existing_user = db.query(User.user_id).filter(User.user_id == TEST_USER_ID).first()
     
     if existing_user and not force_reseed:
         print("✅ 시드 데이터가 이미 존재합니다. 건너뜁니다.")
@@ -367,12 +404,9 @@ def seed_database(db, force_reseed=False):
         print("🔄 기존 시드 데이터를 삭제하고 재삽입합니다...")
         try:
             # 기존 데이터 삭제 (순서 중요: 외래키 참조 순서)
-            db.query(Notification).filter(Notification.user_id == TEST_USER_ID).delete()
-            db.query(SubTask).filter(SubTask.user_id == TEST_USER_ID).delete()
-            db.query(Schedule).filter(Schedule.user_id == TEST_USER_ID).delete()
-            db.query(Lecture).filter(Lecture.user_id == TEST_USER_ID).delete()
-            db.query(User).filter(User.user_id == TEST_USER_ID).delete()
-            db.commit()
+            # 중간 커밋 없이 아래 삽입과 같은 트랜잭션으로 처리 (커밋 1회)
+            for model in (Notification, SubTask, Schedule, Lecture, User):
+                db.execute(delete(model).where(model.user_id == TEST_USER_ID))
             print("  ✓ 기존 데이터 삭제 완료")
         except Exception as e:
             db.rollback()
@@ -381,41 +415,42 @@ def seed_database(db, force_reseed=False):
     
     print("🌱 시드 데이터 삽입을 시작합니다...")
     
+    # 커밋 후 다시 읽을 객체가 없으므로 속성 만료 처리 생략
+    db.expire_on_commit = False
+    
     try:
-        # 1. 사용자 생성
-        user_data = get_seed_user()
-        user = User(**user_data)
-        db.add(user)
-        db.flush()
-        print(f"  ✓ 사용자 생성: {user.email} ({user.name}, {user.school})")
-        
-        # 2. 일정 생성
-        schedules = get_seed_schedules()
-        for s_data in schedules:
-            schedule = Schedule(**s_data)
-            db.add(schedule)
-        print(f"  ✓ 일정 {len(schedules)}개 생성 (해커톤 + 강원대 학사일정)")
-        
-        # 3. 할 일 생성
-        sub_tasks = get_seed_sub_tasks()
-        for t_data in sub_tasks:
-            sub_task = SubTask(**t_data)
-            db.add(sub_task)
-        print(f"  ✓ 할 일 {len(sub_tasks)}개 생성")
-        
-        # 4. 알림 생성 (일정 데이터 필요)
-        notifications = get_seed_notifications(schedules)
-        for n_data in notifications:
-            notification = Notification(**n_data)
-            db.add(notification)
-        print(f"  ✓ 알림 {len(notifications)}개 생성")
-        
-        # 5. 강의 시간표 생성
-        lectures = get_seed_lectures()
-        for l_data in lectures:
-            lecture = Lecture(**l_data)
-            db.add(lecture)
-        print(f"  ✓ 강의 {len(lectures)}개 생성")
+        # 기준 시각은 한 번만 계산해서 공유
+        now = datetime.now()
+        
+        # 쓰기 전용 구간이므로 자동 flush 없이 진행 (사용자 행은 외래키 때문에 직접 flush)
+        with db.no_autoflush:
+            # 1. 사용자 생성
+            user_data = get_seed_user(now)
+            user = User(**user_data)
+            db.add(user)
+            db.flush()
+            print(f"  ✓ 사용자 생성: {user.email} ({user.name}, {user.school})")
+            
+            # 2. 일정 생성 (ORM 매퍼를 거치지 않고 Core 테이블로 multi-row INSERT 한 번)
+            schedules = get_seed_schedules()
+            db.execute(Schedule.__table__.insert(), schedules)
+            print(f"  ✓ 일정 {len(schedules)}개 생성 (해커톤 + 강원대 학사일정)")
+            
+            # 3. 할 일 생성
+            sub_tasks = get_seed_sub_tasks()
+            db.execute(SubTask.__table__.insert(), sub_tasks)
+            print(f"  ✓ 할 일 {len(sub_tasks)}개 생성")
+            
+            # 4. 알림 생성 (일정 데이터 필요)
+            notifications = get_seed_notifications(schedules, now)
+            if notifications:
+                db.execute(Notification.__table__.insert(), notifications)
+            print(f"  ✓ 알림 {len(notifications)}개 생성")
+            
+            # 5. 강의 시간표 생성
+            lectures = get_seed_lectures()
+            db.execute(Lecture.__table__.insert(), lectures)
+            print(f"  ✓ 강의 {len(lectures)}개 생성")
         
         db.commit()
         print("🎉 시드 데이터 삽입 완료!")
@@ -6,9 +6,8 @@ from app.db.database import engine, Base, db_session
 from app.db.seed_data import seed_database
 from app.schemas.ai_chat import ChatRequest, APIResponse, ChatResponseData
 from app.api import user_router, schedule_router, chat_router, lecture_router, sub_task_router, calendar_router, vision_router, notification_router, tasks_router, auth_router, events_router, advanced_router
-from app.core.event_bus import event_bus
-from app.core.monitoring import setup_prometheus
-from sqlalchemy import text
+from app.core.event_bus import event_bus, event_batcher
+from app.core.monitoring import setup_prometheus, check_database
 from contextlib import asynccontextmanager
 from datetime import datetime
 
@@ -29,7 +28,7 @@ async def lifespan(app: FastAPI):
         
         # 이벤트 버스 시작 (Redis Pub/Sub)
         if event_bus.is_available:
-            event_bus.start_listening()
+            await event_bus.start_listening()
             print(" 이벤트 버스 시작 완료")
 
     except Exception as e:
@@ -41,7 +40,8 @@ async def lifespan(app: FastAPI):
     yield
     
     # [Shutdown] 서버 종료 시 실행
-    event_bus.stop_listening()
+    event_batcher.drain()  # 버퍼에 남은 이벤트 발행
+    await event_bus.stop_listening()
     print(" 이벤트 버스 종료")
 
 
@@ -84,10 +84,10 @@ setup_prometheus(app)
 
 # ===== Health Check API =====
 @app.get("/health", tags=["System"])
-def health_check():
+async def health_check():
     """
     시스템 헬스체크 API
-    - 데이터베이스 연결 상태
+    - 데이터베이스 연결 상태 (성공 결과는 짧게 캐싱, 쿼리는 스레드에서 실행)
     - Redis 연결 상태
     - 이벤트 버스 상태
     """
@@ -99,19 +99,17 @@ def health_check():
     }
     
     # 데이터베이스 연결 확인
-    try:
-        db = db_session()
-        db.execute(text("SELECT 1"))
+    db_error = await check_database()
+    if db_error is None:
         health_status["components"]["database"] = {"status": "healthy"}
-        db.close()
-    except Exception as e:
+    else:
         health_status["status"] = "degraded"
         health_status["components"]["database"] = {
             "status": "unhealthy",
-            "error": str(e)
+            "error": db_error
         }
     
-    # 이벤트 버스 (Redis) 상태 확인
+    # 이벤트 버스 (Redis) 상태 확인 (PING 없이 마지막 연결 상태 플래그 사용)
     health_status["components"]["event_bus"] = {
         "status": "healthy" if event_bus.is_available else "unavailable",
         "listening": event_bus.listening if hasattr(event_bus, 'listening') else False
@@ -127,15 +125,12 @@ def liveness_check():
 
 
 @app.get("/health/ready", tags=["System"])
-def readiness_check():
+async def readiness_check():
     """Kubernetes readiness probe용 체크 (DB 연결 포함)"""
-    try:
-        db = db_session()
-        db.execute(text("SELECT 1"))
-        db.close()
+    db_error = await check_database()
+    if db_error is None:
         return {"status": "ready", "timestamp": datetime.now().isoformat()}
-    except Exception as e:
-        return {"status": "not_ready", "error": str(e), "timestamp": datetime.now().isoformat()}
+    return {"status": "not_ready", "error": db_error, "timestamp": datetime.now().isoformat()}
 
 
 # 서버 확인 테스트 용도 (추후 삭제 예정)
@@ -96,6 +96,12 @@ class ChatResponseData(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True, by_alias=True)
 
+# 7) Vision 분석 결과 (Gemini 응답 JSON을 한 번에 검증/변환)
+class VisionResult(BaseModel):
+    image_type: str = "unknown"                 # "schedule" | "poster"
+    lectures: List[LectureItem] = Field(default_factory=list)
+    actions: List[Action] = Field(default_factory=list)
+
 class APIResponse(BaseModel):
     status: int = 200
     message: str
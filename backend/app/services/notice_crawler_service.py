@@ -26,6 +26,12 @@ GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash")
 
 genai.configure(api_key=GOOGLE_API_KEY)
 
+# 공지 날짜 파싱 패턴 (모듈 로드 시 1회 컴파일)
+_DATE_PATTERNS = (
+    re.compile(r"(\d{4})[.-](\d{1,2})[.-](\d{1,2})"),  # 2026-01-31 or 2026.01.31
+    re.compile(r"(\d{1,2})[.-](\d{1,2})"),  # 01-31 (올해로 가정)
+)
+
 
 @dataclass
 class Notice:
@@ -222,13 +228,8 @@ class NoticeCrawler:
     def _parse_date(self, date_str: str) -> datetime:
         """날짜 파싱"""
         # 다양한 날짜 형식 처리
-        patterns = [
-            r"(\d{4})[.-](\d{1,2})[.-](\d{1,2})",  # 2026-01-31 or 2026.01.31
-            r"(\d{1,2})[.-](\d{1,2})",  # 01-31 (올해로 가정)
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(date_str)
             if match:
                 groups = match.groups()
                 if len(groups) == 3:
@@ -313,7 +314,7 @@ class NoticeAnalyzer:
         """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             result = json.loads(response.text)
             
             important_notices = []
@@ -9,6 +9,7 @@
 import os
 import json
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta, date
 from typing import Optional, List, Dict, Any
 
@@ -28,8 +29,9 @@ GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-2.5-flash")
 genai.configure(api_key=GOOGLE_API_KEY)
 
 
+@lru_cache(maxsize=4)
 def get_gemini_model():
-    """Gemini 모델 인스턴스 반환"""
+    """Gemini 모델 인스턴스 반환 (요청 간 재사용)"""
     return genai.GenerativeModel(
         model_name=GEMINI_MODEL_NAME,
         generation_config={
@@ -93,7 +93,7 @@ class SyllabusOCRService:
         prompt = self._build_extraction_prompt()
         
         try:
-            response = self.model.generate_content([
+            response = await self.model.generate_content_async([
                 {"mime_type": mime_type, "data": image_bytes},
                 prompt
             ])
@@ -113,7 +113,7 @@ class SyllabusOCRService:
         prompt = self._build_extraction_prompt()
         
         try:
-            response = self.model.generate_content([
+            response = await self.model.generate_content_async([
                 {"mime_type": "application/pdf", "data": pdf_bytes},
                 prompt
             ])
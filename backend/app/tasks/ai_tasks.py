@@ -6,10 +6,13 @@ AI 관련 비동기 태스크
 """
 
 import os
+import re
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from celery.exceptions import SoftTimeLimitExceeded
 
 from app.core.celery_app import celery_app
 from app.core.cache import cache_service
@@ -17,6 +20,18 @@ from app.db.database import db_session
 
 logger = logging.getLogger(__name__)
 
+# 모델 응답에서 JSON 객체 부분만 추출 (모듈 로드 시 1회 컴파일)
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 이미지 일괄 분석: 이미지 한 장당 허용 시간 (초) - 전역 제한(240/300초) 대신 장수에 비례해 설정
+VISION_BATCH_SECONDS_PER_IMAGE = int(os.getenv("VISION_BATCH_SECONDS_PER_IMAGE", "60"))
+
+
+def vision_batch_time_limits(count: int) -> Tuple[int, int]:
+    """이미지 장수에 맞춘 (soft_time_limit, time_limit) - 강제 종료 전 상태를 기록할 여유 60초"""
+    soft_limit = max(1, count) * VISION_BATCH_SECONDS_PER_IMAGE
+    return soft_limit, soft_limit + 60
+
 
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
 def process_ai_chat(self, user_id: str, message: str, context: Optional[Dict] = None) -> Dict[str, Any]:
@@ -131,8 +146,7 @@ def analyze_schedule_image(self, user_id: str, image_data: str, image_type: str
         result_text = response.text
         try:
             # JSON 추출 시도
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', result_text)
+            json_match = _JSON_OBJECT_RE.search(result_text)
             if json_match:
                 parsed_result = json.loads(json_match.group())
             else:
@@ -172,6 +186,104 @@ def analyze_schedule_image(self, user_id: str, image_data: str, image_type: str
         return error_result
 
 
+@celery_app.task(bind=True)
+def analyze_vision_batch(self, images: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    여러 장의 시간표/포스터 이미지를 한 번에 분석 (백그라운드)
+
+    images: [{"filename": ..., "mime_type": ..., "upload_id": ..., "cache_key": ...}, ...]
+    이미지 bytes는 upload_id로 Redis에서 꺼내 쓰고, 같은 이미지의 분석 결과가
+    cache_key(VISION_RESULT)에 있으면 Gemini 호출 없이 재사용
+    /api/analyze 와 같은 프롬프트·응답 형식을 사용하고,
+    이미지 하나가 실패해도 나머지는 계속 처리
+    시간 제한(vision_batch_time_limits)에 걸리면 그때까지의 결과로 partial/failed 처리
+    """
+    task_id = self.request.id
+    total = len(images)
+    results = []
+
+    try:
+        from app.schemas.ai_chat import VisionResult
+        from app.api.vision_router import model, build_contents, build_response_data
+
+        cache_service.set_task_status(task_id, {
+            "status": "processing",
+            "message": f"이미지 {total}장을 분석 중입니다...",
+            "total": total,
+            "done": 0,
+            "started_at": datetime.now().isoformat(),
+        })
+
+        for done, image in enumerate(images, start=1):
+            item = {"filename": image.get("filename")}
+            try:
+                cached = cache_service.get_vision_result(image["cache_key"])
+                if cached is not None:
+                    result = VisionResult.model_validate(cached)
+                else:
+                    image_bytes = cache_service.get_vision_upload(image["upload_id"])
+                    if image_bytes is None:
+                        raise ValueError("업로드된 이미지가 만료되었거나 찾을 수 없습니다.")
+                    response = model.generate_content(build_contents(image_bytes, image["mime_type"]))
+                    raw = response.text.encode("utf-8")
+                    result = VisionResult.model_validate_json(raw)
+                    cache_service.set_vision_result(image["cache_key"], raw=raw)
+                item["status"] = "completed"
+                item["data"] = build_response_data(result).model_dump(mode="json", by_alias=True)
+            except SoftTimeLimitExceeded:
+                raise
+            except Exception as e:
+                logger.error(f"Vision Batch Item Error ({item['filename']}): {e}")
+                item["status"] = "failed"
+                item["error"] = str(e)
+            finally:
+                cache_service.delete_vision_upload(image["upload_id"])
+            results.append(item)
+
+            cache_service.set_task_status(task_id, {
+                "status": "processing",
+                "message": f"이미지 분석 중... ({done}/{total})",
+                "total": total,
+                "done": done,
+            })
+
+        failed = sum(1 for r in results if r["status"] == "failed")
+        result = {
+            "status": "completed",
+            "message": f"{total - failed}/{total}장의 이미지 분석이 완료되었습니다.",
+            "result": results,
+            "completed_at": datetime.now().isoformat(),
+        }
+        cache_service.set_task_status(task_id, result)
+
+        return result
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"Vision Batch Task Time Limit: {len(results)}/{total}")
+
+        completed = sum(1 for r in results if r["status"] == "completed")
+        timeout_result = {
+            "status": "partial" if completed else "failed",
+            "message": f"시간 제한으로 {total}장 중 {len(results)}장까지만 분석했습니다.",
+            "result": results,
+            "failed_at": datetime.now().isoformat(),
+        }
+        cache_service.set_task_status(task_id, timeout_result)
+        return timeout_result
+
+    except Exception as e:
+        logger.error(f"Vision Batch Task Error: {e}")
+
+        error_result = {
+            "status": "failed",
+            "message": "이미지 일괄 분석 중 오류가 발생했습니다.",
+            "error": str(e),
+            "failed_at": datetime.now().isoformat(),
+        }
+        cache_service.set_task_status(task_id, error_result)
+        return error_result
+
+
 @celery_app.task(bind=True)
 def recalculate_user_priorities(self, user_id: str) -> Dict[str, Any]:
     """